@@ -216,7 +216,7 @@ async def get_milestone_analysis_endpoint(
     event_dt = None
     if event_date:
         try:
-            event_dt = datetime.fromisoformat(event_date.replace("Z", "+00:00"))
+            event_dt = datetime.fromisoformat(event_date)
         except ValueError:
             raise HTTPException(status_code=400, detail="event_date must be ISO format")
     return get_milestone_analysis(plan_id, event_dt)
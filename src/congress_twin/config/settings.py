@@ -5,6 +5,7 @@ NVS-GenAI: Pydantic BaseSettings, load at startup, fail fast on invalid.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field, model_validator
@@ -52,6 +53,10 @@ class AppSettings(BaseSettings):
     )
     # Optional: direct link to open the plan in MS Planner / Teams
     planner_plan_url: Optional[str] = Field(default=None, description="URL to open plan in MS Planner (e.g. Teams task list)")
+    # Read views (attention, execution, milestones, Gantt) share one PlanContext per plan for this long; 0 disables
+    plan_context_ttl_seconds: float = Field(default=5.0, description="Seconds a cached PlanContext is reused across requests")
+    # Task intelligence reuses one plan-level Monte Carlo run for this long; 0 disables
+    simulation_cache_ttl_seconds: float = Field(default=60.0, description="Seconds a plan's task-intelligence simulation is reused")
 
     # Chat semantic layer (Phase 1 Hybrid): optional LLM for intent extraction
     # All values from .env / env only (no hardcoding). Prefer Groq if GROQ_API_KEY set.
@@ -113,12 +118,7 @@ class AppSettings(BaseSettings):
         return [o.strip() for o in self.cors_origins.split(",") if o.strip()]
 
 
-_settings: Optional[AppSettings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
-    """Return settings singleton. Fail fast on first load if invalid."""
-    global _settings
-    if _settings is None:
-        _settings = AppSettings()
-    return _settings
+    """Return settings singleton. Fail fast on first load if invalid (get_settings.cache_clear() reloads)."""
+    return AppSettings()
@@ -490,97 +490,89 @@ def upsert_planner_tasks(plan_id: str, tasks: list[dict[str, Any]]) -> int:
         return 0
     ensure_planner_tasks_table()
     engine = get_engine()
-    # Parse datetimes
-    def _parse_dt(s: str | None):
-        if not s:
-            return None
-        s = (s or "").replace("Z", "+00:00")
-        try:
-            return datetime.fromisoformat(s)
-        except ValueError:
-            return None
-    count = 0
+    rows: list[dict[str, Any]] = []
+    for t in tasks:
+        due = _parse_dt_from_task(t.get("dueDateTime"))
+        start = _parse_dt_from_task(t.get("startDateTime"))
+        last_mod = _parse_dt_from_task(t.get("lastModifiedAt"))
+        completed = _parse_dt_from_task(t.get("completedDateTime"))
+        created = _parse_dt_from_task(t.get("createdDateTime"))
+        assignees = t.get("assignees") or []
+        assignee_names = t.get("assigneeNames") or assignees
+        applied_cats = t.get("appliedCategories") or []
+        rows.append({
+            "tid": t.get("id", ""),
+            "plan_id": plan_id,
+            "bucket_id": t.get("bucketId") or None,
+            "bucket_name": t.get("bucketName") or None,
+            "title": t.get("title", ""),
+            "status": t.get("status", "notStarted"),
+            "percent_complete": t.get("percentComplete", 0),
+            "due_date": due.isoformat() if due else None,
+            "start_date": start.isoformat() if start else None,
+            "last_modified_at": last_mod.isoformat() if last_mod else None,
+            "assignees": _json_param(assignees),
+            "assignee_names": _json_param(assignee_names),
+            "priority": t.get("priority"),
+            "completed_date_time": completed.isoformat() if completed else None,
+            "created_date_time": created.isoformat() if created else None,
+            "order_hint": t.get("orderHint"),
+            "assignee_priority": t.get("assigneePriority"),
+            "applied_categories": _json_param(applied_cats),
+            "conversation_thread_id": t.get("conversationThreadId"),
+            "description": t.get("description"),
+            "preview_type": t.get("previewType"),
+            "created_by": t.get("createdBy"),
+            "completed_by": t.get("completedBy"),
+        })
     try:
         with engine.connect() as conn:
-            for t in tasks:
-                due = _parse_dt(t.get("dueDateTime"))
-                start = _parse_dt(t.get("startDateTime"))
-                last_mod = _parse_dt(t.get("lastModifiedAt"))
-                completed = _parse_dt(t.get("completedDateTime"))
-                created = _parse_dt(t.get("createdDateTime"))
-                assignees = t.get("assignees") or []
-                assignee_names = t.get("assigneeNames") or assignees
-                applied_cats = t.get("appliedCategories") or []
-                conn.execute(
-                    text("""
-                        INSERT INTO planner_tasks (
-                            planner_task_id, planner_plan_id, planner_bucket_id, bucket_name,
-                            title, status, percent_complete, due_date, start_date, last_modified_at,
-                            assignees, assignee_names, priority, completed_date_time, created_date_time,
-                            order_hint, assignee_priority, applied_categories, conversation_thread_id,
-                            description, preview_type, created_by, completed_by
-                        ) VALUES (
-                            :tid, :plan_id, :bucket_id, :bucket_name, :title, :status,
-                            :percent_complete, :due_date, :start_date, :last_modified_at,
-                            :assignees, :assignee_names, :priority, :completed_date_time, :created_date_time,
-                            :order_hint, :assignee_priority, :applied_categories, :conversation_thread_id,
-                            :description, :preview_type, :created_by, :completed_by
-                        )
-                        ON CONFLICT (planner_plan_id, planner_task_id) DO UPDATE SET
-                            planner_bucket_id = EXCLUDED.planner_bucket_id,
-                            bucket_name = EXCLUDED.bucket_name,
-                            title = EXCLUDED.title,
-                            status = EXCLUDED.status,
-                            percent_complete = EXCLUDED.percent_complete,
-                            due_date = EXCLUDED.due_date,
-                            start_date = EXCLUDED.start_date,
-                            last_modified_at = EXCLUDED.last_modified_at,
-                            assignees = EXCLUDED.assignees,
-                            assignee_names = EXCLUDED.assignee_names,
-                            priority = EXCLUDED.priority,
-                            completed_date_time = EXCLUDED.completed_date_time,
-                            created_date_time = EXCLUDED.created_date_time,
-                            order_hint = EXCLUDED.order_hint,
-                            assignee_priority = EXCLUDED.assignee_priority,
-                            applied_categories = EXCLUDED.applied_categories,
-                            conversation_thread_id = EXCLUDED.conversation_thread_id,
-                            description = EXCLUDED.description,
-                            preview_type = EXCLUDED.preview_type,
-                            created_by = EXCLUDED.created_by,
-                            completed_by = EXCLUDED.completed_by
-                    """),
-                    {
-                        "tid": t.get("id", ""),
-                        "plan_id": plan_id,
-                        "bucket_id": t.get("bucketId") or None,
-                        "bucket_name": t.get("bucketName") or None,
-                        "title": t.get("title", ""),
-                        "status": t.get("status", "notStarted"),
-                        "percent_complete": t.get("percentComplete", 0),
-                        "due_date": due.isoformat() if due else None,
-                        "start_date": start.isoformat() if start else None,
-                        "last_modified_at": last_mod.isoformat() if last_mod else None,
-                        "assignees": _json_param(assignees),
-                        "assignee_names": _json_param(assignee_names),
-                        "priority": t.get("priority"),
-                        "completed_date_time": completed.isoformat() if completed else None,
-                        "created_date_time": created.isoformat() if created else None,
-                        "order_hint": t.get("orderHint"),
-                        "assignee_priority": t.get("assigneePriority"),
-                        "applied_categories": _json_param(applied_cats),
-                        "conversation_thread_id": t.get("conversationThreadId"),
-                        "description": t.get("description"),
-                        "preview_type": t.get("previewType"),
-                        "created_by": t.get("createdBy"),
-                        "completed_by": t.get("completedBy"),
-                    },
-                )
-                count += 1
+            # One executemany in a single transaction instead of a statement per task
+            conn.execute(
+                text("""
+                    INSERT INTO planner_tasks (
+                        planner_task_id, planner_plan_id, planner_bucket_id, bucket_name,
+                        title, status, percent_complete, due_date, start_date, last_modified_at,
+                        assignees, assignee_names, priority, completed_date_time, created_date_time,
+                        order_hint, assignee_priority, applied_categories, conversation_thread_id,
+                        description, preview_type, created_by, completed_by
+                    ) VALUES (
+                        :tid, :plan_id, :bucket_id, :bucket_name, :title, :status,
+                        :percent_complete, :due_date, :start_date, :last_modified_at,
+                        :assignees, :assignee_names, :priority, :completed_date_time, :created_date_time,
+                        :order_hint, :assignee_priority, :applied_categories, :conversation_thread_id,
+                        :description, :preview_type, :created_by, :completed_by
+                    )
+                    ON CONFLICT (planner_plan_id, planner_task_id) DO UPDATE SET
+                        planner_bucket_id = EXCLUDED.planner_bucket_id,
+                        bucket_name = EXCLUDED.bucket_name,
+                        title = EXCLUDED.title,
+                        status = EXCLUDED.status,
+                        percent_complete = EXCLUDED.percent_complete,
+                        due_date = EXCLUDED.due_date,
+                        start_date = EXCLUDED.start_date,
+                        last_modified_at = EXCLUDED.last_modified_at,
+                        assignees = EXCLUDED.assignees,
+                        assignee_names = EXCLUDED.assignee_names,
+                        priority = EXCLUDED.priority,
+                        completed_date_time = EXCLUDED.completed_date_time,
+                        created_date_time = EXCLUDED.created_date_time,
+                        order_hint = EXCLUDED.order_hint,
+                        assignee_priority = EXCLUDED.assignee_priority,
+                        applied_categories = EXCLUDED.applied_categories,
+                        conversation_thread_id = EXCLUDED.conversation_thread_id,
+                        description = EXCLUDED.description,
+                        preview_type = EXCLUDED.preview_type,
+                        created_by = EXCLUDED.created_by,
+                        completed_by = EXCLUDED.completed_by
+                """),
+                rows,
+            )
             conn.commit()
     except Exception as e:
         logger.warning("upsert_planner_tasks failed: %s", e)
         raise
-    return count
+    return len(rows)
 
 
 def ensure_planner_task_details_table() -> None:
@@ -662,6 +654,48 @@ def upsert_planner_task_details(plan_id: str, task_id: str, details: dict[str, A
         conn.commit()
 
 
+def upsert_planner_task_details_bulk(plan_id: str, details_by_task: dict[str, dict[str, Any]]) -> int:
+    """
+    Upsert details (checklist, references) for many tasks in one transaction.
+    details_by_task maps task_id -> details. Returns number of rows upserted.
+    """
+    if not details_by_task:
+        return 0
+    ensure_planner_task_details_table()
+    engine = get_engine()
+    rows = [
+        {
+            "task_id": task_id,
+            "plan_id": plan_id,
+            "checklist_items": _json_param(details.get("checklist") or []),
+            "references": _json_param(details.get("references") or []),
+            "last_modified_at": _to_iso_str(details.get("lastModifiedAt")),
+        }
+        for task_id, details in details_by_task.items()
+    ]
+    try:
+        with engine.connect() as conn:
+            conn.execute(
+                text("""
+                    INSERT INTO planner_task_details (
+                        planner_task_id, planner_plan_id, checklist_items, "references", last_modified_at
+                    ) VALUES (
+                        :task_id, :plan_id, :checklist_items, :references, :last_modified_at
+                    )
+                    ON CONFLICT (planner_plan_id, planner_task_id) DO UPDATE SET
+                        checklist_items = EXCLUDED.checklist_items,
+                        "references" = EXCLUDED."references",
+                        last_modified_at = EXCLUDED.last_modified_at
+                """),
+                rows,
+            )
+            conn.commit()
+    except Exception as e:
+        logger.warning("upsert_planner_task_details_bulk failed: %s", e)
+        raise
+    return len(rows)
+
+
 def get_planner_task_details(plan_id: str, task_id: str) -> dict[str, Any] | None:
     """Get task details (checklist, references) for a task."""
     ensure_planner_task_details_table()
@@ -688,6 +722,33 @@ def get_planner_task_details(plan_id: str, task_id: str) -> dict[str, Any] | Non
     }
 
 
+def get_planner_task_details_for_plan(plan_id: str) -> dict[str, dict[str, Any]]:
+    """Get details (checklist, references) for every task in a plan in one query, keyed by task_id."""
+    ensure_planner_task_details_table()
+    try:
+        with get_engine().connect() as conn:
+            r = conn.execute(
+                text("""
+                    SELECT planner_task_id, checklist_items, "references", last_modified_at
+                    FROM planner_task_details
+                    WHERE planner_plan_id = :plan_id
+                """),
+                {"plan_id": plan_id},
+            )
+            rows = r.fetchall()
+    except Exception as e:
+        logger.warning("get_planner_task_details_for_plan failed: %s", e)
+        return {}
+    return {
+        row.planner_task_id: {
+            "checklist": _parse_json_read(getattr(row, "checklist_items", None), []),
+            "references": _parse_json_read(getattr(row, "references", None), []),
+            "lastModifiedAt": getattr(row, "last_modified_at", None),
+        }
+        for row in rows
+    }
+
+
 def upsert_planner_task_dependencies(plan_id: str, task_id: str, dependencies: list[dict[str, Any]]) -> int:
     """
     Upsert task dependencies. dependencies is a list of {dependsOnTaskId, dependencyType}.
@@ -731,6 +792,51 @@ def upsert_planner_task_dependencies(plan_id: str, task_id: str, dependencies: l
     return count
 
 
+def upsert_planner_task_dependencies_bulk(plan_id: str, dependencies_by_task: dict[str, list[dict[str, Any]]]) -> int:
+    """
+    Replace dependencies for many tasks in one transaction.
+    dependencies_by_task maps task_id -> list of {dependsOnTaskId, dependencyType}.
+    Returns number of dependencies upserted.
+    """
+    if not dependencies_by_task:
+        return 0
+    ensure_planner_task_dependencies_table()
+    engine = get_engine()
+    rows = []
+    for task_id, dependencies in dependencies_by_task.items():
+        for dep in dependencies:
+            dep_task_id = dep.get("dependsOnTaskId") or dep.get("depends_on_task_id")
+            if dep_task_id:
+                rows.append({
+                    "plan_id": plan_id,
+                    "task_id": task_id,
+                    "depends_on_task_id": dep_task_id,
+                    "dependency_type": dep.get("dependencyType") or dep.get("dependency_type") or "FS",
+                })
+    try:
+        with engine.connect() as conn:
+            conn.execute(
+                text("DELETE FROM planner_task_dependencies WHERE planner_plan_id = :plan_id AND task_id = :task_id"),
+                [{"plan_id": plan_id, "task_id": task_id} for task_id in dependencies_by_task],
+            )
+            if rows:
+                conn.execute(
+                    text("""
+                        INSERT INTO planner_task_dependencies (
+                            planner_plan_id, task_id, depends_on_task_id, dependency_type
+                        ) VALUES (
+                            :plan_id, :task_id, :depends_on_task_id, :dependency_type
+                        )
+                    """),
+                    rows,
+                )
+            conn.commit()
+    except Exception as e:
+        logger.warning("upsert_planner_task_dependencies_bulk failed: %s", e)
+        raise
+    return len(rows)
+
+
 def get_planner_task_dependencies(plan_id: str, task_id: str | None = None) -> list[dict[str, Any]]:
     """
     Get task dependencies for a plan. If task_id provided, return only dependencies for that task.
@@ -839,9 +945,8 @@ def _parse_dt_from_task(val: str | None) -> datetime | None:
     """Parse datetime from task payload."""
     if not val:
         return None
-    s = (val or "").replace("Z", "+00:00")
     try:
-        return datetime.fromisoformat(s)
+        return datetime.fromisoformat(val)
     except ValueError:
         return None
 
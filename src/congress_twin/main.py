@@ -25,6 +25,8 @@ from congress_twin.config import get_settings
 from congress_twin.api.v1.planner import router as planner_router
 from congress_twin.api.v1.csv_import import router as import_router
 from congress_twin.api.v1.simulation import router as simulation_router
+from congress_twin.services.congress_seed_data import get_congress_seed_tasks
+from congress_twin.services.planner_simulated_data import DEFAULT_PLAN_ID, get_dependency_graph
 
 
 @asynccontextmanager
@@ -32,6 +34,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Init resources at startup; cleanup on shutdown."""
     settings = get_settings()
     # SQLite DB is initialized on first use (get_engine() in planner_repo/events_repo)
+    # Build the in-memory default-plan seed and dependency index now rather than on the first request
+    get_dependency_graph(DEFAULT_PLAN_ID)
+    get_congress_seed_tasks(DEFAULT_PLAN_ID)
     yield
     # TODO: close connections in lifecycle/shutdown
 
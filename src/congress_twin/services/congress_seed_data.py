@@ -8,6 +8,7 @@ so "Due next 7 days", "Critical path due next", and "Recently changed" have data
 """
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 from congress_twin.services.planner_simulated_data import (
@@ -24,7 +25,17 @@ def get_congress_seed_tasks(
     """
     Novartis congress event scheduling tasks: core path + related components.
     Mix of notStarted, inProgress, completed for realistic dashboard and Dependency Lens.
+    Returns fresh (shallow) task dicts on every call; relative dates are applied per call.
     """
+    tasks = [dict(t) for t in _congress_seed_base(plan_id)]
+    if use_relative_dates_for_attention:
+        _apply_relative_dates_for_attention(tasks)
+    return tasks
+
+
+@lru_cache(maxsize=8)
+def _congress_seed_base(plan_id: str) -> tuple[dict[str, Any], ...]:
+    """Static seed tasks with bucketName/assigneeNames resolved; built once per plan_id. Do not mutate."""
     buckets = get_simulated_buckets(plan_id)
     bucket_by_id = {b["id"]: b["name"] for b in buckets}
     b_discovery, b_design, b_build, b_test, b_deploy = (b["id"] for b in buckets)
@@ -203,10 +214,7 @@ def get_congress_seed_tasks(
     for t in tasks:
         t["bucketName"] = bucket_by_id.get(t["bucketId"], "")
         t["assigneeNames"] = [ASSIGNEE_NAMES.get(a, a) for a in t.get("assignees", [])]
-
-    if use_relative_dates_for_attention:
-        _apply_relative_dates_for_attention(tasks)
-    return tasks
+    return tuple(tasks)
 
 
 def _apply_relative_dates_for_attention(tasks: list[dict[str, Any]]) -> None:
@@ -17,7 +17,6 @@ def _parse_datetime(dt_str: str | None) -> datetime | None:
     if not dt_str:
         return None
     try:
-        dt_str = dt_str.replace("Z", "+00:00")
         return datetime.fromisoformat(dt_str)
     except (ValueError, TypeError):
         return None
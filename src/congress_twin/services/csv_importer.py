@@ -30,6 +30,7 @@ from congress_twin.db.planner_repo import (
     upsert_planner_task_details,
     upsert_planner_task_dependencies,
 )
+from congress_twin.services.planner_service import invalidate_plan_context
 
 logger = logging.getLogger(__name__)
 
@@ -255,6 +256,7 @@ def import_csv_to_planner_tasks(plan_id: str, csv_content: str | bytes, bucket_n
         except Exception as e:
             errors.append(f"Failed to upsert dependencies for task {task_id}: {str(e)}")
     
+    invalidate_plan_context(plan_id)
     return {
         "tasks_created": 0,  # Can't distinguish without pre-check
         "tasks_updated": tasks_updated,
@@ -20,7 +20,7 @@ from congress_twin.db.events_repo import (
 )
 from congress_twin.db.planner_repo import get_planner_tasks, upsert_planner_tasks
 from congress_twin.services.planner_simulated_data import DEFAULT_PLAN_ID
-from congress_twin.services.planner_service import get_tasks_for_plan
+from congress_twin.services.planner_service import get_plan_context, invalidate_plan_context
 
 
 def ingest_external_event(
@@ -67,8 +67,9 @@ def _agent_propose_readjustments(
     payload: dict[str, Any],
 ) -> list[dict[str, Any]]:
     """Agent proposes re-adjustments (shift dates, reassign) for human approval."""
-    tasks = get_tasks_for_plan(plan_id)
-    task_by_id = {t["id"]: t for t in tasks}
+    # Shared per-plan context: the id -> task map is built once and reused until the plan is written
+    ctx = get_plan_context(plan_id)
+    tasks, task_by_id = ctx.tasks, ctx.task_by_id
     affected = affected_task_ids or []
     # If no affected tasks given, pick from critical path or first in-progress
     if not affected:
@@ -186,7 +187,7 @@ def _apply_proposed_action(plan_id: str, action: dict[str, Any]) -> None:
             if not s:
                 return None
             try:
-                return datetime.fromisoformat(s.replace("Z", "+00:00"))
+                return datetime.fromisoformat(s)
             except (ValueError, TypeError):
                 return None
         due_dt = _parse(due_s)
@@ -200,6 +201,7 @@ def _apply_proposed_action(plan_id: str, action: dict[str, Any]) -> None:
         break
 
     upsert_planner_tasks(plan_id, task_list)
+    invalidate_plan_context(plan_id)
 
 
 def delete_event_and_actions(event_id: int, plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
@@ -7,6 +7,9 @@ fetch_plan_tasks_from_graph() returns tasks from the Planner plan.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 import requests
@@ -16,6 +19,16 @@ from congress_twin.config import get_settings
 logger = logging.getLogger(__name__)
 
 GRAPH_BASE = "https://graph.microsoft.com/v1.0"
+# Graph JSON batching accepts at most 20 sub-requests per $batch call
+GRAPH_BATCH_LIMIT = 20
+# Throttled/transient sub-requests are re-batched at most this many times, waiting Retry-After (capped) between tries
+GRAPH_BATCH_MAX_RETRIES = 3
+GRAPH_RETRY_AFTER_CAP_SECONDS = 30.0
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# time.monotonic() before which no batch is posted; shared by the batch worker threads
+_throttle_lock = threading.Lock()
+_throttled_until = 0.0
 
 
 def is_graph_configured() -> bool:
@@ -72,76 +85,54 @@ def _extract_identity_set(identity: dict[str, Any] | None) -> Optional[str]:
     return None
 
 
+# MS Planner uses category1, category2, ..., category25
+# Map to meaningful labels if available, otherwise use category name
+_CATEGORY_LABELS = {
+    "category1": "External Dependency",
+    "category2": "High Risk",
+    "category3": "VIP Speaker",
+    "category4": "Urgent",
+    "category5": "Blocked",
+    # Add more mappings as needed
+}
+
+
 def _map_applied_categories(categories: dict[str, Any] | None) -> list[str]:
     """Map appliedCategories (category1-25) to label names."""
     if not categories:
         return []
-    labels = []
-    # MS Planner uses category1, category2, ..., category25
-    # Map to meaningful labels if available, otherwise use category name
-    category_labels = {
-        "category1": "External Dependency",
-        "category2": "High Risk",
-        "category3": "VIP Speaker",
-        "category4": "Urgent",
-        "category5": "Blocked",
-        # Add more mappings as needed
-    }
-    for cat_key, cat_value in categories.items():
-        if cat_value:  # True if category is applied
-            label = category_labels.get(cat_key, cat_key)
-            labels.append(label)
-    return labels
+    # A truthy value means the category is applied
+    return [_CATEGORY_LABELS.get(cat_key, cat_key) for cat_key, cat_value in categories.items() if cat_value]
 
 
 def _normalize_task(graph_task: dict[str, Any], bucket_name_by_id: dict[str, str], task_details: dict[str, Any] | None = None) -> dict[str, Any]:
     """Map Graph plannerTask to our task shape with all MS Planner fields (per ACP_05 PDF reference)."""
-    tid = graph_task.get("id", "")
     percent = graph_task.get("percentComplete", 0)
-    if percent >= 100:
-        status = "completed"
-    elif percent > 0:
-        status = "inProgress"
-    else:
-        status = "notStarted"
-    
     assignments = graph_task.get("assignments") or {}
-    assignee_ids = [k for k in assignments if isinstance(assignments.get(k), dict)]
-    # Extract assignee names if available
-    assignee_names = []
-    for user_id, assignment in assignments.items():
-        if isinstance(assignment, dict):
-            assignee_names.append(user_id)  # Use ID as name if no display name
-    
+    assignee_ids = [user_id for user_id, assignment in assignments.items() if isinstance(assignment, dict)]
     due = _normalize_datetime(graph_task.get("dueDateTime"))
-    start = _normalize_datetime(graph_task.get("startDateTime"))
     completed = _normalize_datetime(graph_task.get("completedDateTime"))
     created = _normalize_datetime(graph_task.get("createdDateTime"))
-    last_mod = completed or created or _normalize_datetime(graph_task.get("dueDateTime"))
-    
     bucket_id = graph_task.get("bucketId") or ""
     
-    # Extract appliedCategories
-    applied_categories = _map_applied_categories(graph_task.get("appliedCategories"))
-    
     task = {
-        "id": tid,
+        "id": graph_task.get("id", ""),
         "title": graph_task.get("title") or "",
         "bucketId": bucket_id,
         "bucketName": bucket_name_by_id.get(bucket_id, ""),
         "percentComplete": percent,
-        "status": status,
+        "status": "completed" if percent >= 100 else "inProgress" if percent > 0 else "notStarted",
         "dueDateTime": due,
-        "startDateTime": start,
+        "startDateTime": _normalize_datetime(graph_task.get("startDateTime")),
         "completedDateTime": completed,
         "createdDateTime": created,
         "assignees": assignee_ids,
-        "assigneeNames": assignee_names,
-        "lastModifiedAt": last_mod,
+        "assigneeNames": list(assignee_ids),  # Use ID as name if no display name
+        "lastModifiedAt": completed or created or due,
         "priority": graph_task.get("priority"),
         "orderHint": graph_task.get("orderHint"),
         "assigneePriority": graph_task.get("assigneePriority"),
-        "appliedCategories": applied_categories,
+        "appliedCategories": _map_applied_categories(graph_task.get("appliedCategories")),
         "conversationThreadId": graph_task.get("conversationThreadId"),
         "createdBy": _extract_identity_set(graph_task.get("createdBy")),
         "completedBy": _extract_identity_set(graph_task.get("completedBy")),
@@ -173,6 +164,96 @@ def fetch_task_details_from_graph(task_id: str, token: str) -> dict[str, Any]:
         raise
 
 
+def _retry_after_seconds(sub: dict[str, Any], attempt: int) -> float:
+    """Delay requested by a throttled sub-response (Retry-After), else exponential backoff; capped."""
+    headers = sub.get("headers") or {}
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    try:
+        delay = float(value)
+    except (TypeError, ValueError):
+        delay = float(2 ** attempt)
+    return min(max(delay, 0.0), GRAPH_RETRY_AFTER_CAP_SECONDS)
+
+
+def _throttle_for(seconds: float) -> None:
+    """Hold back every batch worker for `seconds` (the pause is shared, so one 429 slows them all)."""
+    global _throttled_until
+    with _throttle_lock:
+        _throttled_until = max(_throttled_until, time.monotonic() + seconds)
+
+
+def _wait_for_throttle() -> None:
+    with _throttle_lock:
+        delay = _throttled_until - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def _post_details_batch(task_ids: list[str], token: str) -> dict[str, dict[str, Any]]:
+    """
+    POST $batch task-details GETs. Throttled (429) or transient (5xx) sub-requests are re-batched after their
+    Retry-After delay, up to GRAPH_BATCH_MAX_RETRIES times; whatever still fails is fetched singly (which raises on error).
+    Tasks whose details are not found (404) are omitted.
+    """
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    details_by_id: dict[str, dict[str, Any]] = {}
+    pending = list(task_ids)
+    failed: list[str] = []
+    for attempt in range(GRAPH_BATCH_MAX_RETRIES + 1):
+        _wait_for_throttle()
+        body = {
+            "requests": [
+                {"id": str(i), "method": "GET", "url": f"/planner/tasks/{task_id}/details"}
+                for i, task_id in enumerate(pending)
+            ]
+        }
+        resp = requests.post(f"{GRAPH_BASE}/$batch", headers=headers, json=body, timeout=60)
+        resp.raise_for_status()
+        retry: list[str] = []
+        delay = 0.0
+        for sub in resp.json().get("responses", []):
+            task_id = pending[int(sub.get("id", 0))]
+            status = sub.get("status", 500)
+            if 200 <= status < 300:
+                details_by_id[task_id] = sub.get("body") or {}
+            elif status in _RETRYABLE_STATUSES:
+                retry.append(task_id)
+                delay = max(delay, _retry_after_seconds(sub, attempt))
+            elif status != 404:
+                failed.append(task_id)
+        pending = retry
+        if not pending:
+            break
+        _throttle_for(delay)
+    if pending:
+        logger.warning("Graph still throttling %d task details after %d retries; fetching singly", len(pending), GRAPH_BATCH_MAX_RETRIES)
+        _wait_for_throttle()
+    for task_id in pending + failed:
+        details_by_id[task_id] = fetch_task_details_from_graph(task_id, token)
+    return details_by_id
+
+
+def fetch_task_details_from_graph_batch(
+    task_ids: list[str],
+    token: str,
+    batch_size: int = GRAPH_BATCH_LIMIT,
+    max_workers: int = 8,
+) -> dict[str, dict[str, Any]]:
+    """
+    Fetch details for many tasks using Graph JSON batching ($batch), sending batches concurrently.
+    Returns dict mapping task_id -> details; tasks whose details are not found are omitted.
+    """
+    batch_size = max(1, min(batch_size, GRAPH_BATCH_LIMIT))
+    chunks = [task_ids[i:i + batch_size] for i in range(0, len(task_ids), batch_size)]
+    if not chunks:
+        return {}
+    details_by_id: dict[str, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+        for result in pool.map(lambda chunk: _post_details_batch(chunk, token), chunks):
+            details_by_id.update(result)
+    return details_by_id
+
+
 def fetch_task_dependencies_from_graph(plan_id: str, token: str) -> dict[str, list[dict[str, str]]]:
     """
     Extract task dependencies from references field.
@@ -18,6 +18,7 @@ from congress_twin.db.planner_repo import (
     upsert_planner_task_details,
     upsert_planner_task_dependencies,
 )
+from congress_twin.services.planner_service import invalidate_plan_context
 
 # Set seed for reproducibility
 random.seed(42)
@@ -309,6 +310,7 @@ def generate_historical_plan(plan_id: str, congress_date: datetime, year: int) -
     for task_id, deps in task_dependencies_map.items():
         upsert_planner_task_dependencies(plan_id, task_id, deps)
         dependencies_created += len(deps)
+    invalidate_plan_context(plan_id)
     
     return {
         "plan_id": plan_id,
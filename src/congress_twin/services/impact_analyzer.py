@@ -9,14 +9,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from congress_twin.db.planner_repo import get_planner_task_dependencies
-from congress_twin.services.planner_service import get_tasks_for_plan, get_critical_path
+from congress_twin.services.planner_service import get_plan_context
 
 
 def _parse_iso(s: str | None) -> datetime | None:
     if not s:
         return None
     try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+        return datetime.fromisoformat(s)
     except (ValueError, TypeError):
         return None
 
@@ -43,13 +43,13 @@ def analyze_edit_impact(
     proposed_changes: { dueDateTime?, startDateTime?, assignees?, percentComplete?, new_subtask? }
     Returns: { affected_tasks, downstream_delay_days, critical_path_impact }
     """
-    tasks = get_tasks_for_plan(plan_id)
-    task_by_id = {t["id"]: t for t in tasks}
+    ctx = get_plan_context(plan_id)
+    task_by_id = ctx.task_by_id
     if task_id not in task_by_id:
         return {"error": "Task not found", "affected_tasks": [], "downstream_delay_days": 0, "critical_path_impact": False}
 
     downstream_map = _build_downstream(plan_id)
-    path_res = get_critical_path(plan_id)
+    path_res = ctx.critical_path
     critical_ids = set(path_res.get("task_ids", []))
 
     # Collect all downstream task IDs (BFS)
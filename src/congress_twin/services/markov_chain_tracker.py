@@ -8,6 +8,7 @@ Transition probabilities calibrated from historical data.
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from congress_twin.db.planner_repo import get_planner_tasks
@@ -15,12 +16,12 @@ from congress_twin.db.planner_repo import get_planner_tasks
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
 def _parse_datetime(dt_str: str | None) -> datetime | None:
-    """Parse ISO datetime string."""
+    """Parse ISO datetime string (memoized per string)."""
     if not dt_str:
         return None
     try:
-        dt_str = dt_str.replace("Z", "+00:00")
         return datetime.fromisoformat(dt_str)
     except (ValueError, TypeError):
         return None
@@ -10,14 +10,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from congress_twin.services.planner_simulated_data import DEFAULT_PLAN_ID
-from congress_twin.services.planner_service import get_dependencies_for_plan, get_tasks_for_plan
+from congress_twin.services.planner_service import get_plan_context
 
 
 def _parse_iso(s: str | None) -> datetime | None:
     if not s:
         return None
     try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+        return datetime.fromisoformat(s)
     except (ValueError, TypeError):
         return None
 
@@ -35,9 +35,8 @@ def run_monte_carlo(
     """
     if seed is not None:
         random.seed(seed)
-    tasks = get_tasks_for_plan(plan_id)
-    deps = get_dependencies_for_plan(plan_id)
-    task_by_id = {t["id"]: t for t in tasks}
+    ctx = get_plan_context(plan_id)
+    tasks, deps, task_by_id = ctx.tasks, ctx.deps, ctx.task_by_id
 
     # Build upstream map and topological order for critical path
     upstream: dict[str, set[str]] = {t["id"]: set() for t in tasks}
@@ -45,8 +44,7 @@ def run_monte_carlo(
         upstream[task_id].add(depends_on)
 
     # Topological order (simplified: use critical path order from longest chain)
-    from congress_twin.services.planner_service import get_critical_path
-    path_res = get_critical_path(plan_id)
+    path_res = ctx.critical_path
     critical_ids = path_res["task_ids"]
     # All task IDs in dependency order for simulation
     all_ids = list(task_by_id.keys())
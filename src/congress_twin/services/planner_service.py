@@ -4,8 +4,14 @@ Planner service: attention metrics, dependencies, critical path.
 Uses SQLite for persistence; simulated data fallback for DEFAULT_PLAN_ID if no DB data.
 """
 
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import cached_property
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Iterator, NamedTuple
 
 from congress_twin.config import get_settings
 from congress_twin.db.planner_repo import (
@@ -19,20 +25,16 @@ from congress_twin.db.planner_repo import (
     set_plan_sync_state,
     upsert_checklist_item as repo_upsert_checklist_item,
     upsert_planner_tasks as db_upsert_planner_tasks,
-    upsert_planner_task_details,
-    upsert_planner_task_dependencies,
+    upsert_planner_task_details_bulk,
+    upsert_planner_task_dependencies_bulk,
     update_planner_task as repo_update_task,
 )
-from congress_twin.services.graph_client import (
-    fetch_plan_tasks_from_graph,
-    fetch_task_details_from_graph,
-    fetch_task_dependencies_from_graph,
-    get_token,
-    is_graph_configured,
-)
 from congress_twin.services.congress_seed_data import get_congress_seed_tasks
 from congress_twin.services.planner_simulated_data import (
     DEFAULT_PLAN_ID,
+    DependencyGraph,
+    build_dependency_graph,
+    get_dependency_graph,
     get_simulated_buckets,
     get_simulated_dependencies,
 )
@@ -46,231 +48,396 @@ def get_dependencies_for_plan(plan_id: str) -> list[tuple[str, str]]:
     rows = get_planner_task_dependencies(plan_id, None)
     if rows:
         return [(r.get("taskId") or r.get("task_id", ""), r.get("dependsOnTaskId") or r.get("depends_on_task_id", "")) for r in rows]
-    return get_simulated_dependencies(plan_id)
+    return list(get_dependency_graph(plan_id).edges)
 
 
 def _seed_congress_dependencies(plan_id: str) -> None:
     """Upsert congress seed dependencies into DB for the default plan."""
     deps = get_simulated_dependencies(plan_id)
-    # Group by task_id: task_id -> [depends_on_task_id, ...]
-    by_task: dict[str, list[str]] = {}
+    # Group by task_id: task_id -> [{dependsOnTaskId, dependencyType}, ...]
+    by_task: dict[str, list[dict[str, str]]] = {}
     for task_id, depends_on_id in deps:
-        by_task.setdefault(task_id, []).append(depends_on_id)
-    for task_id, depends_on_ids in by_task.items():
-        upsert_planner_task_dependencies(
-            plan_id,
-            task_id,
-            [{"dependsOnTaskId": dep_id, "dependencyType": "FS"} for dep_id in depends_on_ids],
+        by_task.setdefault(task_id, []).append({"dependsOnTaskId": depends_on_id, "dependencyType": "FS"})
+    upsert_planner_task_dependencies_bulk(plan_id, by_task)
+
+
+class _PlanDag(NamedTuple):
+    """In-plan dependency graph keyed by integer position (iloc) in the plan's task list."""
+
+    ids: list[str]
+    predecessors: list[list[int]]
+    dependents: list[list[int]]
+
+
+class _TaskColumns(NamedTuple):
+    """NumPy struct-of-arrays over the plan's tasks (same order as PlanContext.tasks).
+
+    Bulk date/status filters scan these columns; task dicts are only touched for the rows selected.
+    """
+
+    due: Any  # float64 epoch seconds of dueDateTime, NaN when missing (missing compares False)
+    last_modified: Any  # float64 epoch seconds of lastModifiedAt, NaN when missing
+    completed: Any  # bool, status == "completed"
+
+
+@dataclass
+class PlanContext:
+    """
+    Tasks for one plan plus lookups derived from them, built once and shared by the views below.
+    Cached by get_plan_context; see there for invalidation and out-of-process writes.
+    """
+
+    plan_id: str
+    tasks: list[dict[str, Any]]
+    task_by_id: dict[str, dict[str, Any]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.task_by_id = {t["id"]: t for t in self.tasks}
+
+    @cached_property
+    def deps(self) -> list[tuple[str, str]]:
+        return get_dependencies_for_plan(self.plan_id)
+
+    @cached_property
+    def graph(self) -> DependencyGraph:
+        """Dependency edges with both ends in the plan, indexed once per context."""
+        return build_dependency_graph(self.deps, self.task_by_id)
+
+    @property
+    def upstream(self) -> dict[str, frozenset[str]]:
+        """task_id -> ids it depends on. Tasks without edges are absent."""
+        return self.graph.upstream
+
+    @property
+    def downstream(self) -> dict[str, frozenset[str]]:
+        """task_id -> ids that depend on it. Tasks without edges are absent."""
+        return self.graph.downstream
+
+    @cached_property
+    def blocked_ids(self) -> frozenset[str]:
+        """Tasks not completed with at least one in-plan upstream task not completed (attention + execution views)."""
+        task_by_id, upstream = self.task_by_id, self.upstream
+        blocked: set[str] = set()
+        for tid, up_ids in upstream.items():
+            if task_by_id[tid].get("status", "notStarted") == "completed":
+                continue
+            for up_id in up_ids:
+                if task_by_id[up_id].get("status") != "completed":
+                    blocked.add(tid)
+                    break
+        return frozenset(blocked)
+
+    @cached_property
+    def iloc_by_id(self) -> dict[str, int]:
+        """task_id -> dense position 0..N-1 (order of task_by_id)."""
+        return {tid: i for i, tid in enumerate(self.task_by_id)}
+
+    @cached_property
+    def dag(self) -> _PlanDag:
+        ids = list(self.task_by_id)
+        iloc_by_id = self.iloc_by_id
+        predecessors: list[list[int]] = [[] for _ in ids]
+        dependents: list[list[int]] = [[] for _ in ids]
+        seen: set[tuple[int, int]] = set()
+        for t_id, depends_on in self.deps:
+            i = iloc_by_id.get(t_id)
+            j = iloc_by_id.get(depends_on)
+            if i is None or j is None or (i, j) in seen:
+                continue
+            seen.add((i, j))
+            predecessors[i].append(j)
+            dependents[j].append(i)
+        return _PlanDag(ids, predecessors, dependents)
+
+    @cached_property
+    def _parsed_dates(self) -> tuple[dict[str, datetime | None], ...]:
+        due: dict[str, datetime | None] = {}
+        start: dict[str, datetime | None] = {}
+        last_mod: dict[str, datetime | None] = {}
+        for t in self.tasks:
+            tid = t["id"]
+            due[tid] = _parse_iso_utc(t.get("dueDateTime"))
+            start[tid] = _parse_iso_utc(t.get("startDateTime"))
+            last_mod[tid] = _parse_iso_utc(t.get("lastModifiedAt"))
+        return due, start, last_mod
+
+    @property
+    def due_dt_by_id(self) -> dict[str, datetime | None]:
+        """task_id -> parsed dueDateTime (timezone-aware); all task dates are parsed once per context."""
+        return self._parsed_dates[0]
+
+    @property
+    def start_dt_by_id(self) -> dict[str, datetime | None]:
+        """task_id -> parsed startDateTime."""
+        return self._parsed_dates[1]
+
+    @property
+    def last_mod_dt_by_id(self) -> dict[str, datetime | None]:
+        """task_id -> parsed lastModifiedAt."""
+        return self._parsed_dates[2]
+
+    @cached_property
+    def columns(self) -> _TaskColumns | None:
+        """Columnar view for vectorised filters; None when NumPy is not installed."""
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        nan = float("nan")
+        due_dt_by_id, last_mod_dt_by_id = self.due_dt_by_id, self.last_mod_dt_by_id
+        due: list[float] = []
+        last_modified: list[float] = []
+        completed: list[bool] = []
+        for t in self.tasks:
+            due_dt = due_dt_by_id[t["id"]]
+            last_mod_dt = last_mod_dt_by_id[t["id"]]
+            due.append(due_dt.timestamp() if due_dt else nan)
+            last_modified.append(last_mod_dt.timestamp() if last_mod_dt else nan)
+            completed.append(t.get("status", "notStarted") == "completed")
+        return _TaskColumns(
+            np.array(due, dtype=np.float64),
+            np.array(last_modified, dtype=np.float64),
+            np.array(completed, dtype=bool),
         )
 
+    @cached_property
+    def critical_path(self) -> dict[str, Any]:
+        return _critical_path(self)
+
+    @cached_property
+    def critical_ids(self) -> frozenset[str]:
+        """Ids on critical_path, for O(1) membership tests."""
+        return frozenset(self.critical_path["task_ids"])
+
+    @cached_property
+    def summary_by_id(self) -> dict[str, dict[str, Any]]:
+        """task_id -> the summary fields every task list in the views reports. Shared: treat as read-only."""
+        return {
+            t["id"]: {
+                "id": t["id"],
+                "title": t["title"],
+                "status": t.get("status"),
+                "dueDateTime": t.get("dueDateTime"),
+                "assigneeNames": t.get("assigneeNames", []),
+            }
+            for t in self.tasks
+        }
+
+
+def _owned_copy(shared: dict[str, Any], **extra: Any) -> dict[str, Any]:
+    """Copy of a dict shared through PlanContext (nested lists/dicts included) that callers may mutate, plus extra keys."""
+    copy = {k: v.copy() if isinstance(v, (list, dict)) else v for k, v in shared.items()}
+    copy.update(extra)
+    return copy
+
+
+def _summarize(ctx: PlanContext, task_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    summary_by_id = ctx.summary_by_id
+    return [_owned_copy(summary_by_id[t["id"]]) for t in task_list]
+
+
+# plan_id -> (time.monotonic() when built, context); see plan_context_ttl_seconds
+_plan_context_cache: dict[str, tuple[float, PlanContext]] = {}
+
+
+def get_plan_context(plan_id: str) -> PlanContext:
+    """
+    Shared PlanContext for plan_id, reused for plan_context_ttl_seconds. Its contents are shared across requests:
+    public views return copies (_owned_copy), never the context's own dicts and lists.
+
+    Staleness: writers in this process must call invalidate_plan_context after changing a plan's tasks or
+    dependencies. Writes from other processes (e.g. scripts/seed_congress_db.py calling upsert_planner_tasks
+    directly) cannot invalidate this cache and only show up once the cached context expires.
+    """
+    ttl = get_settings().plan_context_ttl_seconds
+    if ttl <= 0:
+        return PlanContext(plan_id=plan_id, tasks=get_tasks_for_plan(plan_id))
+    now = time.monotonic()
+    cached = _plan_context_cache.get(plan_id)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    ctx = PlanContext(plan_id=plan_id, tasks=get_tasks_for_plan(plan_id))
+    _plan_context_cache[plan_id] = (now, ctx)
+    return ctx
+
+
+def invalidate_plan_context(plan_id: str | None = None) -> None:
+    """Drop the cached PlanContext for plan_id (all plans when None). Call after writing tasks or dependencies."""
+    if plan_id is None:
+        _plan_context_cache.clear()
+    else:
+        _plan_context_cache.pop(plan_id, None)
+    # Plan-level simulations derive from the same data (lazy import: task_intelligence imports this module)
+    from congress_twin.services.task_intelligence import invalidate_simulation_cache
+    invalidate_simulation_cache(plan_id)
+
 
 def _parse_iso(s: str | None) -> datetime | None:
+    """ISO 8601 string to datetime; None when missing or invalid. fromisoformat accepts a trailing "Z" on Python 3.11+."""
     if not s:
         return None
     try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+        return datetime.fromisoformat(s)
     except (ValueError, TypeError):
         return None
 
 
+def _parse_iso_utc(s: str | None) -> datetime | None:
+    """_parse_iso with naive values taken as UTC, so comparisons and .timestamp() agree on every host."""
+    dt = _parse_iso(s)
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
 def get_attention_dashboard(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
     """
     Compute blockers, overdue, due next 7 days, recently changed.
     Blocked = not completed and at least one upstream dependency not completed.
     """
-    tasks = get_tasks_for_plan(plan_id)
-    deps = get_dependencies_for_plan(plan_id)
-    task_by_id = {t["id"]: t for t in tasks}
+    ctx = get_plan_context(plan_id)
+    tasks = ctx.tasks
+    due_dt_by_id = ctx.due_dt_by_id
     now = datetime.now(timezone.utc)
     one_day_ago = now - timedelta(days=1)
     seven_days_later = now + timedelta(days=7)
 
-    # Upstream: task_id -> list of task_ids it depends on (only for tasks in plan)
-    upstream: dict[str, set[str]] = {t["id"]: set() for t in tasks}
-    for t_id, depends_on in deps:
-        if t_id in upstream:
-            upstream[t_id].add(depends_on)
-
-    path_res = get_critical_path(plan_id)
-    critical_ids = set(path_res["task_ids"])
-
-    blockers: list[dict[str, Any]] = []
-    overdue: list[dict[str, Any]] = []
-    due_next_7: list[dict[str, Any]] = []
-    recently_changed: list[dict[str, Any]] = []
-    critical_path_due_next: list[dict[str, Any]] = []
-
-    for t in tasks:
-        tid = t["id"]
-        status = t.get("status", "notStarted")
-        due_s = t.get("dueDateTime")
-        due_dt = _parse_iso(due_s)
-        last_mod_s = t.get("lastModifiedAt")
-        last_mod_dt = _parse_iso(last_mod_s)
-
-        # Blocked: not done and any upstream (in plan) not done
-        if status != "completed" and upstream.get(tid):
-            upstream_in_plan = [up_id for up_id in upstream[tid] if up_id in task_by_id]
-            any_upstream_incomplete = any(
-                task_by_id[up_id].get("status") != "completed"
-                for up_id in upstream_in_plan
-            )
-            if upstream_in_plan and any_upstream_incomplete:
-                blockers.append(t)
-
-        # Overdue: due in the past and not completed
-        if due_dt and due_dt < now and status != "completed":
-            overdue.append(t)
-
-        # Due next 7 days
-        if due_dt and now <= due_dt <= seven_days_later and status != "completed":
-            due_next_7.append(t)
+    critical_ids = ctx.critical_ids
 
-        # Recently changed (last 24h)
-        if last_mod_dt and last_mod_dt >= one_day_ago:
-            recently_changed.append(t)
+    # Blocked: not done and any upstream (in plan) not done
+    blocked_ids = ctx.blocked_ids
+    blockers = [t for t in tasks if t["id"] in blocked_ids]
 
-        # Critical path tasks due in next 7 days (not completed)
-        if tid in critical_ids and status != "completed" and due_dt and now <= due_dt <= seven_days_later:
-            critical_path_due_next.append(t)
-
-    def _summarize(task_list: list[dict]) -> list[dict]:
-        return [
-            {
-                "id": t["id"],
-                "title": t["title"],
-                "status": t.get("status"),
-                "dueDateTime": t.get("dueDateTime"),
-                "assigneeNames": t.get("assigneeNames", []),
-            }
-            for t in task_list
+    cols = ctx.columns
+    if cols is not None:
+        # NaN (missing date) compares False, matching the "due_dt and ..." guards below
+        now_ts = now.timestamp()
+        due, is_open = cols.due, ~cols.completed
+        overdue = [tasks[i] for i in ((due < now_ts) & is_open).nonzero()[0]]
+        due_next_7 = [
+            tasks[i] for i in ((due >= now_ts) & (due <= seven_days_later.timestamp()) & is_open).nonzero()[0]
         ]
+        recently_changed = [tasks[i] for i in (cols.last_modified >= one_day_ago.timestamp()).nonzero()[0]]
+    else:
+        # One fused pass: overdue and due-next-7 are disjoint (due < now vs. due >= now), so share the guard
+        last_mod_dt_by_id = ctx.last_mod_dt_by_id
+        overdue, due_next_7, recently_changed = [], [], []
+        for t in tasks:
+            tid = t["id"]
+            due_dt = due_dt_by_id[tid]
+            if due_dt and t.get("status", "notStarted") != "completed":
+                # Overdue: due in the past; otherwise due within the next 7 days
+                if due_dt < now:
+                    overdue.append(t)
+                elif due_dt <= seven_days_later:
+                    due_next_7.append(t)
+
+            # Recently changed (last 24h)
+            last_mod_dt = last_mod_dt_by_id[tid]
+            if last_mod_dt and last_mod_dt >= one_day_ago:
+                recently_changed.append(t)
+
+    # Critical path tasks due in next 7 days (not completed)
+    critical_path_due_next = [t for t in due_next_7 if t["id"] in critical_ids]
 
     return {
         "plan_id": plan_id,
-        "blockers": {"count": len(blockers), "tasks": _summarize(blockers)},
-        "overdue": {"count": len(overdue), "tasks": _summarize(overdue)},
-        "due_next_7_days": {"count": len(due_next_7), "tasks": _summarize(due_next_7)},
-        "critical_path_due_next": {"count": len(critical_path_due_next), "tasks": _summarize(critical_path_due_next)},
-        "recently_changed": {"count": len(recently_changed), "tasks": _summarize(recently_changed)},
+        "blockers": {"count": len(blockers), "tasks": _summarize(ctx, blockers)},
+        "overdue": {"count": len(overdue), "tasks": _summarize(ctx, overdue)},
+        "due_next_7_days": {"count": len(due_next_7), "tasks": _summarize(ctx, due_next_7)},
+        "critical_path_due_next": {"count": len(critical_path_due_next), "tasks": _summarize(ctx, critical_path_due_next)},
+        "recently_changed": {"count": len(recently_changed), "tasks": _summarize(ctx, recently_changed)},
     }
 
 
 def get_dependencies(task_id: str, plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
     """Upstream = must finish before this; downstream = impacted if this slips."""
-    tasks = get_tasks_for_plan(plan_id)
-    deps = get_dependencies_for_plan(plan_id)
-    task_by_id = {t["id"]: t for t in tasks}
-
-    upstream_ids: set[str] = set()
-    downstream_ids: set[str] = set()
-
-    for t_id, depends_on in deps:
-        if t_id == task_id and depends_on in task_by_id:
-            upstream_ids.add(depends_on)
-        if depends_on == task_id and t_id in task_by_id:
-            downstream_ids.add(t_id)
-
-    def _summarize(ids: set[str]) -> list[dict]:
-        return [
-            {
-                "id": tid,
-                "title": task_by_id[tid]["title"],
-                "status": task_by_id[tid].get("status"),
-                "dueDateTime": task_by_id[tid].get("dueDateTime"),
-                "assigneeNames": task_by_id[tid].get("assigneeNames", []),
-            }
-            for tid in sorted(ids)
-            if tid in task_by_id
-        ]
+    ctx = get_plan_context(plan_id)
+    summary_by_id = ctx.summary_by_id
+    # Adjacency is already deduplicated and limited to in-plan tasks; sort each side once by id
+    upstream = [_owned_copy(summary_by_id[tid]) for tid in sorted(ctx.upstream.get(task_id, ()))]
+    downstream = [_owned_copy(summary_by_id[tid]) for tid in sorted(ctx.downstream.get(task_id, ()))]
 
     # Impact statement: "If Task X slips 3 days, these N tasks may move."
-    downstream_count = len(downstream_ids)
-    downstream_titles = [task_by_id[tid]["title"] for tid in sorted(downstream_ids) if tid in task_by_id]
-    if downstream_count:
-        impact = f"If this task slips 3 days, {downstream_count} downstream task(s) may move: {', '.join(downstream_titles[:5])}{'…' if len(downstream_titles) > 5 else ''}."
+    if downstream:
+        titles = ", ".join(d["title"] for d in downstream[:5])
+        impact = f"If this task slips 3 days, {len(downstream)} downstream task(s) may move: {titles}{'…' if len(downstream) > 5 else ''}."
     else:
         impact = "No downstream dependencies."
 
     return {
         "task_id": task_id,
-        "upstream": _summarize(upstream_ids),
-        "downstream": _summarize(downstream_ids),
+        "upstream": upstream,
+        "downstream": downstream,
         "impact_statement": impact,
     }
 
 
 def get_critical_path(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
     """Longest dependency chain (DAG longest path) as critical path."""
-    deps = get_dependencies_for_plan(plan_id)
-    tasks = get_tasks_for_plan(plan_id)
-    task_by_id = {t["id"]: t for t in tasks}
-    all_ids = {t["id"] for t in tasks}
+    path = get_plan_context(plan_id).critical_path
+    return {
+        "plan_id": path["plan_id"],
+        "critical_path": [_owned_copy(s) for s in path["critical_path"]],
+        "task_ids": list(path["task_ids"]),
+    }
 
-    if not all_ids:
-        return {"plan_id": plan_id, "critical_path": [], "task_ids": []}
 
-    # Only consider dependencies where both ends are in the plan's task list
-    deps_in_plan = [(t_id, depends_on) for t_id, depends_on in deps if t_id in all_ids and depends_on in all_ids]
-
-    # dependents[depends_on] = set of task_ids that depend on it
-    dependents: dict[str, set[str]] = {tid: set() for tid in all_ids}
-    for t_id, depends_on in deps_in_plan:
-        dependents[depends_on].add(t_id)
-
-    # Topological order (Kahn): in_degree = number of deps that must complete before this task
-    in_degree: dict[str, int] = {tid: 0 for tid in all_ids}
-    for t_id, _ in deps_in_plan:
-        in_degree[t_id] = in_degree.get(t_id, 0) + 1
-    order: list[str] = []
-    stack = [tid for tid in all_ids if in_degree[tid] == 0]
-    while stack:
-        n = stack.pop()
-        order.append(n)
-        for m in dependents.get(n, set()):
+def _topological_order(predecessors: list[list[int]], dependents: list[list[int]]) -> Iterator[int]:
+    """
+    Kahn's algorithm, yielding each node as soon as it is released; nodes left on a cycle follow in plan order.
+    Plans are sparse, so tasks without dependencies are emitted first in one flat pass that bypasses the queue
+    (the order is the same as queueing them).
+    """
+    in_degree = [len(p) for p in predecessors]
+    ready: deque[int] = deque()
+    pop, push = ready.popleft, ready.append
+    for i in [i for i, d in enumerate(in_degree) if not d]:
+        yield i
+        for m in dependents[i]:
             in_degree[m] -= 1
-            if in_degree[m] == 0:
-                stack.append(m)
-    if len(order) != len(all_ids):
-        order = list(all_ids)  # fallback if cycle
-
-    # Predecessors: task_id -> list of task_ids it depends on
-    predecessors: dict[str, list[str]] = {tid: [] for tid in all_ids}
-    for t_id, depends_on in deps_in_plan:
-        predecessors[t_id].append(depends_on)
-
-    # Longest path length ending at each node (DAG)
-    dist: dict[str, int] = {}
-    prev: dict[str, str] = {}
-    for n in order:
-        preds = predecessors[n]
-        if not preds:
-            dist[n] = 1
-            prev[n] = ""
-        else:
-            best_p = max(preds, key=lambda p: dist.get(p, 0))
-            dist[n] = dist.get(best_p, 0) + 1
-            prev[n] = best_p
-
-    # End node with max dist, backtrack for path
-    end_node = max(all_ids, key=lambda x: dist.get(x, 0))
-    path_ids: list[str] = []
-    cur = end_node
-    while cur:
-        path_ids.append(cur)
-        cur = prev.get(cur, "")
-
-    path_ids.reverse()
-    critical_tasks = [
-        {
-            "id": tid,
-            "title": task_by_id[tid]["title"],
-            "status": task_by_id[tid].get("status"),
-            "dueDateTime": task_by_id[tid].get("dueDateTime"),
-            "assigneeNames": task_by_id[tid].get("assigneeNames", []),
-        }
-        for tid in path_ids
-    ]
+            if not in_degree[m]:
+                push(m)
+    while ready:
+        i = pop()
+        yield i
+        for m in dependents[i]:
+            in_degree[m] -= 1
+            if not in_degree[m]:
+                push(m)
+    yield from (i for i, d in enumerate(in_degree) if d)
+
+
+def _critical_path(ctx: PlanContext) -> dict[str, Any]:
+    plan_id = ctx.plan_id
+    ids, predecessors, dependents = ctx.dag
+    n = len(ids)
+
+    # No in-plan edges (none at all, or all to tasks outside the plan): there is no chain, skip the DAG pass
+    if not n or not ctx.graph.edges:
+        return {"plan_id": plan_id, "critical_path": [], "task_ids": []}
+
+    # Longest path length ending at each node, filled in topological order; prev = -1 marks a path start
+    dist = [0] * n
+    prev = [-1] * n
+    for i in _topological_order(predecessors, dependents):
+        # First predecessor with the longest path wins (same tie-break as max())
+        best_d, best_p = 0, -1
+        for p in predecessors[i]:
+            d = dist[p]
+            if d > best_d:
+                best_d, best_p = d, p
+        dist[i] = best_d + 1
+        prev[i] = best_p
+
+    # End node with max dist; its dist is the path length, so fill the path back to front
+    cur = max(range(n), key=dist.__getitem__)
+    path_ids: list[str] = [""] * dist[cur]
+    for k in range(len(path_ids) - 1, -1, -1):
+        path_ids[k] = ids[cur]
+        cur = prev[cur]
+    summary_by_id = ctx.summary_by_id
+    critical_tasks = [summary_by_id[tid] for tid in path_ids]
 
     return {
         "plan_id": plan_id,
@@ -287,62 +454,75 @@ def get_milestone_analysis(
     Milestone / Event Date lane: tasks that must complete before event date,
     and tasks at risk (not completed, due after event date).
     """
-    tasks = get_tasks_for_plan(plan_id)
-    path_res = get_critical_path(plan_id)
-    critical_ids = set(path_res["task_ids"])
-    task_by_id = {t["id"]: t for t in tasks}
-    now = datetime.now(timezone.utc)
+    return _milestone_analysis(get_plan_context(plan_id), event_date)
+
+
+def _event_partition(
+    ctx: PlanContext,
+    event_date: datetime | None,
+) -> tuple[datetime, list[int], list[int]]:
+    """
+    Resolve the event date and split ctx.tasks into positions of tasks due by the event
+    and of open tasks due after it (or undated).
+    """
+    tasks = ctx.tasks
     if event_date is None:
         # Default: 21 days from now (e.g. go-live)
-        event_date = now + timedelta(days=21)
+        event_date = datetime.now(timezone.utc) + timedelta(days=21)
     if event_date.tzinfo is None:
         event_date = event_date.replace(tzinfo=timezone.utc)
 
-    tasks_before_event: list[dict[str, Any]] = []
-    at_risk_tasks: list[dict[str, Any]] = []
-
-    for t in tasks:
-        due_s = t.get("dueDateTime")
-        due_dt = _parse_iso(due_s)
-        status = t.get("status", "notStarted")
-        if due_dt and due_dt <= event_date:
-            tasks_before_event.append(t)
-        if status != "completed" and due_dt and due_dt > event_date:
-            days_over = (due_dt - event_date).days
-            at_risk_tasks.append({
-                **t,
-                "days_after_event": days_over,
-            })
-        elif status != "completed" and due_dt is None:
-            at_risk_tasks.append({**t, "days_after_event": None})
-
-    def _summarize(task_list: list[dict]) -> list[dict]:
-        return [
-            {
-                "id": t["id"],
-                "title": t["title"],
-                "status": t.get("status"),
-                "dueDateTime": t.get("dueDateTime"),
-                "assigneeNames": t.get("assigneeNames", []),
-                "on_critical_path": t["id"] in critical_ids,
-            }
-            for t in task_list
-        ]
-
+    due_dt_by_id = ctx.due_dt_by_id
+    cols = ctx.columns
+    if cols is not None:
+        # NaN (no due date) fails "<=", so undated open tasks fall into at-risk as in the loop below
+        on_time = cols.due <= event_date.timestamp()
+        before_idx = on_time.nonzero()[0].tolist()
+        at_risk_idx = (~on_time & ~cols.completed).nonzero()[0].tolist()
+    else:
+        before_idx, at_risk_idx = [], []
+        for i, t in enumerate(tasks):
+            due_dt = due_dt_by_id[t["id"]]
+            if due_dt and due_dt <= event_date:
+                before_idx.append(i)
+            elif t.get("status", "notStarted") != "completed":
+                at_risk_idx.append(i)
+    return event_date, before_idx, at_risk_idx
+
+
+def _at_risk_ids(ctx: PlanContext, event_date: datetime | None) -> set[str]:
+    """Ids of open tasks due after the event (or undated), without building the milestone payload."""
+    tasks = ctx.tasks
+    _, _, at_risk_idx = _event_partition(ctx, event_date)
+    return {tasks[i]["id"] for i in at_risk_idx}
+
+
+def _milestone_analysis(ctx: PlanContext, event_date: datetime | None) -> dict[str, Any]:
+    """Milestone analysis on a loaded context."""
+    plan_id, tasks = ctx.plan_id, ctx.tasks
+    critical_ids = ctx.critical_ids
+    event_date, before_idx, at_risk_idx = _event_partition(ctx, event_date)
+    due_dt_by_id = ctx.due_dt_by_id
+
+    tasks_before_event = [tasks[i] for i in before_idx]
+    # (task, days_after_event) pairs; projected once below instead of copying each task dict
+    at_risk_tasks: list[tuple[dict[str, Any], int | None]] = []
+    for i in at_risk_idx:
+        t = tasks[i]
+        due_dt = due_dt_by_id[t["id"]]
+        at_risk_tasks.append((t, (due_dt - event_date).days if due_dt else None))
+
+    summary_by_id = ctx.summary_by_id
     return {
         "plan_id": plan_id,
         "event_date": event_date.isoformat(),
-        "tasks_before_event": _summarize(tasks_before_event),
+        "tasks_before_event": [
+            _owned_copy(summary_by_id[t["id"]], on_critical_path=t["id"] in critical_ids)
+            for t in tasks_before_event
+        ],
         "at_risk_tasks": [
-            {
-                "id": t["id"],
-                "title": t["title"],
-                "status": t.get("status"),
-                "dueDateTime": t.get("dueDateTime"),
-                "assigneeNames": t.get("assigneeNames", []),
-                "days_after_event": t.get("days_after_event"),
-            }
-            for t in at_risk_tasks
+            _owned_copy(summary_by_id[t["id"]], days_after_event=days_over)
+            for t, days_over in at_risk_tasks
         ],
         "at_risk_count": len(at_risk_tasks),
     }
@@ -353,90 +533,102 @@ def get_changes_since_sync(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
     Tasks modified in Planner since previous sync (last_modified_at > previous_sync_at).
     Used for "Changes since publish" / "What changed since last sync".
     """
-    tasks = get_tasks_for_plan(plan_id)
+    ctx = get_plan_context(plan_id)
+    tasks = ctx.tasks
     _, previous_sync_at_raw = get_plan_sync_state(plan_id)
     previous_sync_at: datetime
     if not previous_sync_at_raw:
         previous_sync_at = datetime.now(timezone.utc) - timedelta(hours=24)
     else:
-        # SQLite returns TEXT as str; parse to datetime for comparison
-        previous_sync_at = _parse_iso(str(previous_sync_at_raw)) or datetime.now(timezone.utc) - timedelta(hours=24)
-    changed = [
-        {
-            "id": t["id"],
-            "title": t["title"],
-            "status": t.get("status"),
-            "dueDateTime": t.get("dueDateTime"),
-            "assigneeNames": t.get("assigneeNames", []),
-            "lastModifiedAt": t.get("lastModifiedAt"),
-        }
-        for t in tasks
-        if _parse_iso(t.get("lastModifiedAt")) and _parse_iso(t.get("lastModifiedAt")) > previous_sync_at
-    ]
+        # SQLite returns TEXT as str (naive when stored naive); parse as UTC, like the task dates it is compared with
+        previous_sync_at = _parse_iso_utc(str(previous_sync_at_raw)) or datetime.now(timezone.utc) - timedelta(hours=24)
+
+    cols = ctx.columns
+    if cols is not None:
+        changed_tasks = [tasks[i] for i in (cols.last_modified > previous_sync_at.timestamp()).nonzero()[0]]
+    else:
+        last_mod_dt_by_id = ctx.last_mod_dt_by_id
+        changed_tasks = []
+        for t in tasks:
+            last_mod_dt = last_mod_dt_by_id[t["id"]]
+            if last_mod_dt and last_mod_dt > previous_sync_at:
+                changed_tasks.append(t)
+    summary_by_id = ctx.summary_by_id
+    changed = [_owned_copy(summary_by_id[t["id"]], lastModifiedAt=t.get("lastModifiedAt")) for t in changed_tasks]
     return {"plan_id": plan_id, "changes": changed, "count": len(changed)}
 
 
+# Execution-view flag bits; the low four select a precomputed badge tuple (badge order is fixed)
+_BADGE_BLOCKED, _BADGE_BLOCKING, _BADGE_AT_RISK, _BADGE_OVERDUE = 1, 2, 4, 8
+_BADGE_MASK = 15
+_ON_CRITICAL_PATH = 16
+_RISK_BADGES: tuple[tuple[str, ...], ...] = tuple(
+    tuple(
+        name
+        for bit, name in (
+            (_BADGE_BLOCKED, "blocked"),
+            (_BADGE_BLOCKING, "blocking"),
+            (_BADGE_AT_RISK, "at_risk"),
+            (_BADGE_OVERDUE, "overdue"),
+        )
+        if combo & bit
+    )
+    for combo in range(_BADGE_MASK + 1)
+)
+
+
 def get_execution_tasks(plan_id: str = DEFAULT_PLAN_ID) -> list[dict[str, Any]]:
     """
     Tasks enriched for execution/Dependency Lens: risk badges (blocked, blocking, at_risk, overdue)
     and upstream_count, downstream_count per task.
     """
-    tasks = get_tasks_for_plan(plan_id)
-    deps = get_dependencies_for_plan(plan_id)
-    path_res = get_milestone_analysis(plan_id, event_date=None)
-    path_res_cp = get_critical_path(plan_id)
-    task_by_id = {t["id"]: t for t in tasks}
+    ctx = get_plan_context(plan_id)
+    tasks, task_by_id = ctx.tasks, ctx.task_by_id
+    due_dt_by_id = ctx.due_dt_by_id
+    critical_ids = ctx.critical_ids
+    at_risk_ids = _at_risk_ids(ctx, event_date=None)
     now = datetime.now(timezone.utc)
-    critical_ids = set(path_res_cp["task_ids"])
-    at_risk_ids = {t["id"] for t in path_res.get("at_risk_tasks", [])}
-
-    upstream: dict[str, set[str]] = {t["id"]: set() for t in tasks}
-    downstream: dict[str, set[str]] = {t["id"]: set() for t in tasks}
-    for t_id, depends_on in deps:
-        if t_id in upstream and depends_on in downstream:
-            upstream[t_id].add(depends_on)
-            downstream[depends_on].add(t_id)
-
-    blocker_ids: set[str] = set()
-    for t in tasks:
-        tid = t["id"]
-        status = t.get("status", "notStarted")
-        if status != "completed" and upstream.get(tid):
-            upstream_in_plan = [up_id for up_id in upstream[tid] if up_id in task_by_id]
-            if any(task_by_id[up_id].get("status") != "completed" for up_id in upstream_in_plan):
-                blocker_ids.add(tid)
 
-    blocking_ids: set[str] = set()  # not done and upstream of any critical path task
+    upstream, downstream = ctx.upstream, ctx.downstream
+
+    # Per-task flag bits, indexed by iloc
+    iloc_by_id = ctx.iloc_by_id
+    flags = bytearray(len(iloc_by_id))
+    for tid in ctx.blocked_ids:
+        flags[iloc_by_id[tid]] |= _BADGE_BLOCKED
+
     for tid in critical_ids:
-        for up_id in upstream.get(tid, set()):
-            if up_id in task_by_id and task_by_id[up_id].get("status") != "completed":
-                blocking_ids.add(up_id)
+        flags[iloc_by_id[tid]] |= _ON_CRITICAL_PATH
+        # Blocking: not done and upstream of any critical path task
+        for up_id in upstream.get(tid, ()):
+            if task_by_id[up_id].get("status") != "completed":
+                flags[iloc_by_id[up_id]] |= _BADGE_BLOCKING
+
+    for tid in at_risk_ids:
+        flags[iloc_by_id[tid]] |= _BADGE_AT_RISK
+
+    cols = ctx.columns
+    if cols is not None:
+        overdue = ((cols.due < now.timestamp()) & ~cols.completed).tolist()
+    else:
+        overdue = [
+            bool(due_dt_by_id[t["id"]] and due_dt_by_id[t["id"]] < now and t.get("status", "notStarted") != "completed")
+            for t in tasks
+        ]
 
     result: list[dict[str, Any]] = []
-    for t in tasks:
+    for t, is_overdue in zip(tasks, overdue):
         tid = t["id"]
-        due_dt = _parse_iso(t.get("dueDateTime"))
-        status = t.get("status", "notStarted")
-        overdue = bool(due_dt and due_dt < now and status != "completed")
-        at_risk = tid in at_risk_ids
-        blocked = tid in blocker_ids
-        blocking = tid in blocking_ids
-        risk_badges: list[str] = []
-        if blocked:
-            risk_badges.append("blocked")
-        if blocking:
-            risk_badges.append("blocking")
-        if at_risk:
-            risk_badges.append("at_risk")
-        if overdue:
-            risk_badges.append("overdue")
-        result.append({
-            **t,
-            "risk_badges": risk_badges,
-            "upstream_count": len(upstream.get(tid, set())),
-            "downstream_count": len(downstream.get(tid, set())),
-            "on_critical_path": tid in critical_ids,
-        })
+        f = flags[iloc_by_id[tid]]
+        if is_overdue:
+            f |= _BADGE_OVERDUE
+        result.append(_owned_copy(
+            t,
+            risk_badges=list(_RISK_BADGES[f & _BADGE_MASK]),
+            upstream_count=len(upstream.get(tid, ())),
+            downstream_count=len(downstream.get(tid, ())),
+            on_critical_path=bool(f & _ON_CRITICAL_PATH),
+        ))
     return result
 
 
@@ -445,17 +637,14 @@ def list_plans() -> list[dict[str, Any]]:
     List plans: from DB plus seed/simulated (uc31-plan, congress-2022, congress-2023, congress-2024).
     """
     from_db = repo_list_plans()
-    known_ids = {p["plan_id"] for p in from_db}
+    seen = {p["plan_id"] for p in from_db}
     seed_plans = [
         {"plan_id": DEFAULT_PLAN_ID, "name": "UC31 Congress Plan", "congress_date": None, "source_plan_id": None, "created_at": None},
         {"plan_id": "congress-2022", "name": "Congress 2022", "congress_date": "2022-03-15", "source_plan_id": None, "created_at": None},
         {"plan_id": "congress-2023", "name": "Congress 2023", "congress_date": "2023-03-20", "source_plan_id": None, "created_at": None},
         {"plan_id": "congress-2024", "name": "Congress 2024", "congress_date": "2024-03-18", "source_plan_id": None, "created_at": None},
     ]
-    for p in seed_plans:
-        if p["plan_id"] not in known_ids:
-            from_db.append(p)
-            known_ids.add(p["plan_id"])
+    from_db.extend(p for p in seed_plans if p["plan_id"] not in seen)
     return from_db
 
 
@@ -479,7 +668,9 @@ def create_planner_task(plan_id: str, task: dict[str, Any]) -> dict[str, Any]:
         raise ValueError(f"Unknown bucketId: {bucket_id}")
     task = dict(task)
     task["bucketName"] = task.get("bucketName") or bucket_by_id.get(bucket_id, "")
-    return repo_create_task(plan_id, task)
+    created = repo_create_task(plan_id, task)
+    invalidate_plan_context(plan_id)
+    return created
 
 
 def update_planner_task(plan_id: str, task_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
@@ -494,29 +685,39 @@ def update_planner_task(plan_id: str, task_id: str, updates: dict[str, Any]) ->
         if updates["bucketId"] not in bucket_ids:
             raise ValueError(f"Unknown bucketId: {updates['bucketId']}")
         updates["bucketName"] = bucket_by_id.get(updates["bucketId"], "")
-    return repo_update_task(plan_id, task_id, updates)
+    updated = repo_update_task(plan_id, task_id, updates)
+    invalidate_plan_context(plan_id)
+    return updated
 
 
 def delete_planner_task(plan_id: str, task_id: str) -> bool:
     """Delete a task. Returns True if deleted."""
-    return repo_delete_task(plan_id, task_id)
+    deleted = repo_delete_task(plan_id, task_id)
+    invalidate_plan_context(plan_id)
+    return deleted
 
 
 def add_subtask(plan_id: str, task_id: str, item: dict[str, Any]) -> dict[str, Any]:
     """Add or update a checklist item (subtask). Returns the created/updated item."""
-    return repo_upsert_checklist_item(plan_id, task_id, item)
+    saved = repo_upsert_checklist_item(plan_id, task_id, item)
+    invalidate_plan_context(plan_id)
+    return saved
 
 
 def update_subtask(plan_id: str, task_id: str, subtask_id: str, item: dict[str, Any]) -> dict[str, Any]:
     """Update a checklist item. Returns the updated item."""
     item = dict(item)
     item["id"] = subtask_id
-    return repo_upsert_checklist_item(plan_id, task_id, item)
+    saved = repo_upsert_checklist_item(plan_id, task_id, item)
+    invalidate_plan_context(plan_id)
+    return saved
 
 
 def delete_subtask(plan_id: str, task_id: str, subtask_id: str) -> bool:
     """Remove a checklist item. Returns True if removed."""
-    return repo_delete_checklist_item(plan_id, task_id, subtask_id)
+    deleted = repo_delete_checklist_item(plan_id, task_id, subtask_id)
+    invalidate_plan_context(plan_id)
+    return deleted
 
 
 def get_tasks_for_plan(plan_id: str) -> list[dict[str, Any]]:
@@ -545,6 +746,15 @@ def sync_planner_tasks(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
     Sync tasks from MS Planner (or simulated when Graph not configured).
     When Graph is configured and token is obtained, fetches from Graph API and persists to DB (Postgres or SQLite).
     """
+    # Graph client (and its HTTP stack) is only needed here; keep it off the import path of read views
+    from congress_twin.services.graph_client import (
+        fetch_plan_tasks_from_graph,
+        fetch_task_details_from_graph_batch,
+        fetch_task_dependencies_from_graph,
+        get_token,
+        is_graph_configured,
+    )
+
     if is_graph_configured():
         token = get_token()
         if token:
@@ -555,24 +765,26 @@ def sync_planner_tasks(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
                     db_upsert_planner_tasks(plan_id, tasks)
                     
                     # Fetch and store task details (checklist, references)
-                    for task in tasks:
-                        task_id = task.get("id")
-                        if task_id:
-                            # Details are already in task dict from expanded query, but fetch separately to ensure we have checklist/references
-                            details = fetch_task_details_from_graph(task_id, token)
-                            if details:
-                                upsert_planner_task_details(plan_id, task_id, {
-                                    "checklist": details.get("checklist", {}),
-                                    "references": details.get("references", {}),
-                                    "lastModifiedAt": details.get("lastModifiedDateTime"),
-                                })
-                    
+                    # Details are already in task dict from expanded query, but fetch separately to ensure we have checklist/references
+                    task_ids = [task["id"] for task in tasks if task.get("id")]
+                    details_by_id = fetch_task_details_from_graph_batch(task_ids, token)
+                    details_rows: dict[str, dict[str, Any]] = {}
+                    for task_id in task_ids:
+                        details = details_by_id.get(task_id)
+                        if details:
+                            details_rows[task_id] = {
+                                "checklist": details.get("checklist", {}),
+                                "references": details.get("references", {}),
+                                "lastModifiedAt": details.get("lastModifiedDateTime"),
+                            }
+                    upsert_planner_task_details_bulk(plan_id, details_rows)
+
                     # Fetch and store dependencies
                     dependencies_map = fetch_task_dependencies_from_graph(plan_id, token)
-                    for task_id, deps in dependencies_map.items():
-                        upsert_planner_task_dependencies(plan_id, task_id, deps)
-                        
+                    upsert_planner_task_dependencies_bulk(plan_id, dependencies_map)
+
                 except Exception as db_e:
+                    invalidate_plan_context(plan_id)
                     return {
                         "plan_id": plan_id,
                         "status": "error",
@@ -580,6 +792,7 @@ def sync_planner_tasks(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
                         "tasks_synced": 0,
                         "message": f"Graph sync succeeded but DB write failed: {db_e!s}",
                     }
+                invalidate_plan_context(plan_id)
                 set_plan_sync_state(plan_id, datetime.now(timezone.utc), get_plan_sync_state(plan_id)[0])
                 return {
                     "plan_id": plan_id,
@@ -601,6 +814,7 @@ def sync_planner_tasks(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
             db_upsert_planner_tasks(plan_id, tasks)
         except Exception:
             pass
+        invalidate_plan_context(plan_id)
         set_plan_sync_state(plan_id, datetime.now(timezone.utc), get_plan_sync_state(plan_id)[0])
         return {
             "plan_id": plan_id,
@@ -614,6 +828,7 @@ def sync_planner_tasks(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
         db_upsert_planner_tasks(plan_id, tasks)
     except Exception:
         pass
+    invalidate_plan_context(plan_id)
     set_plan_sync_state(plan_id, datetime.now(timezone.utc), get_plan_sync_state(plan_id)[0])
     return {
         "plan_id": plan_id,
@@ -637,6 +852,7 @@ def seed_congress_plan(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
     ensure_plan_sync_state_table()
     tasks = get_congress_seed_tasks(plan_id, use_relative_dates_for_attention=True)
     db_upsert_planner_tasks(plan_id, tasks)
+    invalidate_plan_context(plan_id)
     now = datetime.now(timezone.utc)
     set_plan_sync_state(plan_id, now, previous_sync_at=now)
     return {
@@ -654,32 +870,32 @@ def get_probability_gantt(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
     Tasks with start/end and variance for Probability Gantt.
     Uses task startDateTime/dueDateTime and variance_days when present (planning data).
     """
-    path_res = get_critical_path(plan_id)
-    tasks = get_tasks_for_plan(plan_id)
-    task_by_id = {t["id"]: t for t in tasks}
+    ctx = get_plan_context(plan_id)
+    tasks, task_by_id = ctx.tasks, ctx.task_by_id
+    due_dt_by_id, start_dt_by_id = ctx.due_dt_by_id, ctx.start_dt_by_id
+    path_res = ctx.critical_path
     critical_ids = set(path_res["task_ids"])
     now = datetime.now(timezone.utc)
 
-    bars: list[dict[str, Any]] = []
+    # (start timestamp, bar) pairs so the final sort compares floats rather than ISO strings
+    bars: list[tuple[float, dict[str, Any]]] = []
     for i, tid in enumerate(path_res["task_ids"]):
         t = task_by_id.get(tid)
         if not t:
             continue
-        start_s = t.get("startDateTime")
-        due_s = t.get("dueDateTime")
-        start_dt = _parse_iso(start_s)
-        due_dt = _parse_iso(due_s)
+        start_dt = start_dt_by_id[tid]
+        due_dt = due_dt_by_id[tid]
         if not start_dt and due_dt:
             start_dt = due_dt - timedelta(days=5)
         if not due_dt:
             due_dt = now
         if not start_dt:
             start_dt = due_dt - timedelta(days=5)
-        variance_days = t.get("variance_days") or (2 if tid in critical_ids else 1)
+        variance_days = t.get("variance_days") or 2
         # Confidence from percent complete or default
         pct = t.get("percentComplete", 0)
         confidence = pct if 0 <= pct <= 100 else max(70, 95 - i * 3)
-        bars.append({
+        bars.append((start_dt.timestamp(), {
             "id": tid,
             "title": t["title"],
             "status": t.get("status"),
@@ -688,27 +904,24 @@ def get_probability_gantt(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
             "confidence_percent": confidence,
             "variance_days": variance_days,
             "on_critical_path": True,
-        })
-    for t in tasks:
-        if t["id"] in critical_ids:
-            continue
-        start_s = t.get("startDateTime")
-        due_s = t.get("dueDateTime")
-        due_dt = _parse_iso(due_s)
-        start_dt = _parse_iso(start_s) if start_s else (due_dt - timedelta(days=4) if due_dt else None)
-        if due_dt and len(bars) < 12:
-            bars.append({
-                "id": t["id"],
-                "title": t["title"],
-                "status": t.get("status"),
-                "start_date": (start_dt or due_dt).isoformat(),
-                "end_date": due_dt.isoformat(),
-                "confidence_percent": t.get("percentComplete", 78),
-                "variance_days": t.get("variance_days", 1),
-                "on_critical_path": False,
-            })
-    bars.sort(key=lambda x: (x["start_date"] or ""))
-    return {"plan_id": plan_id, "bars": bars}
+        }))
+    # Top up to 12 bars with dated non-critical tasks in plan order; the scan stops once the cap is reached
+    non_critical = (t for t in tasks if t["id"] not in critical_ids and due_dt_by_id[t["id"]])
+    for t in islice(non_critical, max(0, 12 - len(bars))):
+        due_dt = due_dt_by_id[t["id"]]
+        start_dt = (start_dt_by_id[t["id"]] if t.get("startDateTime") else due_dt - timedelta(days=4)) or due_dt
+        bars.append((start_dt.timestamp(), {
+            "id": t["id"],
+            "title": t["title"],
+            "status": t.get("status"),
+            "start_date": start_dt.isoformat(),
+            "end_date": due_dt.isoformat(),
+            "confidence_percent": t.get("percentComplete", 78),
+            "variance_days": t.get("variance_days", 1),
+            "on_critical_path": False,
+        }))
+    bars.sort(key=itemgetter(0))
+    return {"plan_id": plan_id, "bars": [bar for _, bar in bars]}
 
 
 def get_mitigation_feed(plan_id: str = DEFAULT_PLAN_ID) -> dict[str, Any]:
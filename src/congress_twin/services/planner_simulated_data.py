@@ -4,8 +4,11 @@ Simulated MS Planner data for Congress Twin (no Graph API).
 Planning-related data: fixed date ranges, % complete, variance (2d/1d), critical path.
 """
 
+from collections import defaultdict
+from collections.abc import Container, Iterable
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 DEFAULT_PLAN_ID = "uc31-plan"
 
@@ -19,13 +22,19 @@ ASSIGNEE_NAMES: dict[str, str] = {
 
 def get_simulated_buckets(plan_id: str = DEFAULT_PLAN_ID) -> list[dict[str, Any]]:
     """Simulated buckets (columns) for the plan."""
-    return [
+    return [dict(b) for b in _simulated_buckets_base(plan_id)]
+
+
+@lru_cache(maxsize=8)
+def _simulated_buckets_base(plan_id: str) -> tuple[dict[str, Any], ...]:
+    """Buckets built once per plan_id. Do not mutate."""
+    return (
         {"id": f"{plan_id}-bucket-discovery", "name": "Discovery", "order_hint": " !"},
         {"id": f"{plan_id}-bucket-design", "name": "Design", "order_hint": "  !"},
         {"id": f"{plan_id}-bucket-build", "name": "Build", "order_hint": "   !"},
         {"id": f"{plan_id}-bucket-test", "name": "Test", "order_hint": "    !"},
         {"id": f"{plan_id}-bucket-deploy", "name": "Deploy", "order_hint": "     !"},
-    ]
+    )
 
 
 def get_simulated_tasks(plan_id: str = DEFAULT_PLAN_ID) -> list[dict[str, Any]]:
@@ -33,7 +42,13 @@ def get_simulated_tasks(plan_id: str = DEFAULT_PLAN_ID) -> list[dict[str, Any]]:
     Planning-related tasks: fixed start/end dates (Feb 2026), % complete, variance.
     All on critical path for this plan.
     """
-    buckets = get_simulated_buckets(plan_id)
+    return [dict(t) for t in _simulated_tasks_base(plan_id)]
+
+
+@lru_cache(maxsize=8)
+def _simulated_tasks_base(plan_id: str) -> tuple[dict[str, Any], ...]:
+    """Tasks with bucketName/assigneeNames resolved; built once per plan_id. Do not mutate."""
+    buckets = _simulated_buckets_base(plan_id)
     bucket_by_id = {b["id"]: b["name"] for b in buckets}
     b_discovery, b_design, b_build, b_test, b_deploy = (b["id"] for b in buckets)
 
@@ -51,12 +66,18 @@ def get_simulated_tasks(plan_id: str = DEFAULT_PLAN_ID) -> list[dict[str, Any]]:
     for t in tasks:
         t["bucketName"] = bucket_by_id.get(t["bucketId"], "")
         t["assigneeNames"] = [ASSIGNEE_NAMES.get(a, a) for a in t.get("assignees", [])]
-    return tasks
+    return tuple(tasks)
 
 
 def get_simulated_dependencies(plan_id: str = DEFAULT_PLAN_ID) -> list[tuple[str, str]]:
     """(task_id, depends_on_task_id). Congress critical path + supporting/related task dependencies."""
-    return [
+    return list(_simulated_dependencies_base(plan_id))
+
+
+@lru_cache(maxsize=8)
+def _simulated_dependencies_base(plan_id: str) -> tuple[tuple[str, str], ...]:
+    """Dependency edges built once per plan_id."""
+    return (
         # Core congress path
         ("task-002", "task-001"),
         ("task-003", "task-002"),
@@ -74,4 +95,39 @@ def get_simulated_dependencies(plan_id: str = DEFAULT_PLAN_ID) -> list[tuple[str
         ("task-013", "task-007"),   # Post-event survey after handover
         ("task-014", "task-001"),   # Stakeholder alignment after agenda
         ("task-015", "task-002"),   # Marketing collateral after speaker confirmations
-    ]
+    )
+
+
+class DependencyGraph(NamedTuple):
+    """Dependency edges plus adjacency maps; frozensets so one instance can be shared safely."""
+
+    edges: tuple[tuple[str, str], ...]
+    upstream: dict[str, frozenset[str]]  # task_id -> task_ids it depends on
+    downstream: dict[str, frozenset[str]]  # task_id -> task_ids that depend on it
+
+
+def build_dependency_graph(
+    edges: Iterable[tuple[str, str]],
+    task_ids: Container[str] | None = None,
+) -> DependencyGraph:
+    """Index (task_id, depends_on_task_id) edges; when task_ids is given, keep only edges with both ends in it."""
+    kept: list[tuple[str, str]] = []
+    upstream: defaultdict[str, set[str]] = defaultdict(set)
+    downstream: defaultdict[str, set[str]] = defaultdict(set)
+    for t_id, depends_on in edges:
+        if task_ids is not None and (t_id not in task_ids or depends_on not in task_ids):
+            continue
+        kept.append((t_id, depends_on))
+        upstream[t_id].add(depends_on)
+        downstream[depends_on].add(t_id)
+    return DependencyGraph(
+        tuple(kept),
+        {k: frozenset(v) for k, v in upstream.items()},
+        {k: frozenset(v) for k, v in downstream.items()},
+    )
+
+
+@lru_cache(maxsize=None)
+def get_dependency_graph(plan_id: str = DEFAULT_PLAN_ID) -> DependencyGraph:
+    """Simulated dependencies indexed once per plan (see get_simulated_dependencies)."""
+    return build_dependency_graph(_simulated_dependencies_base(plan_id))
@@ -9,9 +9,13 @@ Combines:
 - Dependency optimization for critical path
 """
 
+import heapq
 import logging
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 
@@ -28,11 +32,12 @@ def _to_utc(dt: datetime | None) -> datetime | None:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
+from congress_twin.config import get_settings
 from congress_twin.db.planner_repo import (
     get_planner_task_dependencies,
     get_planner_task_details,
 )
-from congress_twin.services.planner_service import get_tasks_for_plan
+from congress_twin.services.planner_service import PlanContext, get_plan_context
 from congress_twin.services.historical_analyzer import (
     analyze_duration_bias,
     compute_resource_throughput,
@@ -40,47 +45,120 @@ from congress_twin.services.historical_analyzer import (
 )
 from congress_twin.services.markov_chain_tracker import get_markov_analysis
 from congress_twin.services.monte_carlo_simulator import run_simulation
-from congress_twin.services.planner_service import get_critical_path
 from congress_twin.services.planner_simulated_data import DEFAULT_PLAN_ID
 
 logger = logging.getLogger(__name__)
 
+# Historical plans only change when regenerated, so their throughput is reused for a few minutes
+_THROUGHPUT_TTL_SECONDS = 300.0
+_throughput_cache: dict[tuple[str, ...], tuple[float, dict[str, Any]]] = {}
 
+
+def _cached_resource_throughput(plan_ids: list[str]) -> dict[str, Any]:
+    """compute_resource_throughput(plan_ids), reused for _THROUGHPUT_TTL_SECONDS. Treat the result as read-only."""
+    key = tuple(sorted(plan_ids))
+    now = time.monotonic()
+    cached = _throughput_cache.get(key)
+    if cached and now - cached[0] < _THROUGHPUT_TTL_SECONDS:
+        return cached[1]
+    throughput = compute_resource_throughput(plan_ids)
+    _throughput_cache[key] = (now, throughput)
+    return throughput
+
+
+_simulation_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+def _cached_simulation(plan_id: str) -> dict[str, Any]:
+    """
+    Plan-level Monte Carlo run shared by every task's intelligence, reused for
+    simulation_cache_ttl_seconds. Treat the result as read-only.
+    """
+    ttl = get_settings().simulation_cache_ttl_seconds
+    if ttl <= 0:
+        # Use smaller iterations for performance
+        return run_simulation(plan_id, n_iterations=1000)
+    now = time.monotonic()
+    cached = _simulation_cache.get(plan_id)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    result = run_simulation(plan_id, n_iterations=1000)
+    _simulation_cache[plan_id] = (now, result)
+    return result
+
+
+def invalidate_simulation_cache(plan_id: str | None = None) -> None:
+    """Drop the cached simulation for plan_id (all plans when None). Called from invalidate_plan_context."""
+    if plan_id is None:
+        _simulation_cache.clear()
+    else:
+        _simulation_cache.pop(plan_id, None)
+
+
+@lru_cache(maxsize=8192)
 def _parse_datetime(dt_str: str | None) -> datetime | None:
-    """Parse ISO datetime string."""
+    """Parse ISO datetime string (memoized: the same timestamps recur across tasks and calls)."""
     if not dt_str:
         return None
     try:
-        dt_str = dt_str.replace("Z", "+00:00")
         return datetime.fromisoformat(dt_str)
     except (ValueError, TypeError):
         return None
 
 
-def _compute_assignee_workload(plan_id: str, assignee: str, exclude_task_id: str | None = None) -> dict[str, Any]:
-    """Compute current workload for an assignee."""
-    tasks = get_tasks_for_plan(plan_id)
-    assignee_tasks = [
-        t for t in tasks
-        if assignee in (t.get("assignees") or []) and t.get("id") != exclude_task_id
-    ]
-    
-    active_tasks = [t for t in assignee_tasks if t.get("status") != "completed"]
-    overdue_tasks = [
-        t for t in active_tasks
-        if _to_utc(_parse_datetime(t.get("dueDateTime"))) and _to_utc(_parse_datetime(t.get("dueDateTime"))) < _utc_now()
-    ]
-    
+def _workload(total: int, active: int, overdue: int) -> dict[str, Any]:
     return {
-        "total_tasks": len(assignee_tasks),
-        "active_tasks": len(active_tasks),
-        "overdue_tasks": len(overdue_tasks),
-        "utilization_score": len(active_tasks) / 5.0 if len(active_tasks) > 0 else 0.0,  # Normalize to 0-1
+        "total_tasks": total,
+        "active_tasks": active,
+        "overdue_tasks": overdue,
+        "utilization_score": active / 5.0 if active > 0 else 0.0,  # Normalize to 0-1
     }
 
 
+def _build_workload_index(ctx: PlanContext, exclude_task_id: str | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Workload per assignee from a single pass over the plan's tasks.
+    Assignees of the excluded task are still listed (with zero counts if it is their only task).
+    """
+    tasks = ctx.tasks
+    now = _utc_now()
+    cols = ctx.columns
+    if cols is not None:
+        # Vectorised status/due checks; a missing due date (NaN) is never overdue
+        is_open = ~cols.completed
+        active_flags = is_open.tolist()
+        overdue_flags = ((cols.due < now.timestamp()) & is_open).tolist()
+    else:
+        due_dt_by_id = ctx.due_dt_by_id
+        active_flags = [t.get("status") != "completed" for t in tasks]
+        overdue_flags = []
+        for t, active in zip(tasks, active_flags):
+            due = _to_utc(due_dt_by_id[t["id"]]) if active else None
+            overdue_flags.append(due is not None and due < now)
+
+    counts: dict[str, list[int]] = {}
+    for t, active, overdue in zip(tasks, active_flags, overdue_flags):
+        # dict.fromkeys: an assignee listed twice on one task still counts that task once
+        assignees = dict.fromkeys(t.get("assignees") or [])
+        if t.get("id") == exclude_task_id:
+            for assignee in assignees:
+                counts.setdefault(assignee, [0, 0, 0])
+            continue
+        for assignee in assignees:
+            c = counts.setdefault(assignee, [0, 0, 0])
+            c[0] += 1
+            c[1] += active
+            c[2] += overdue
+    return {assignee: _workload(*c) for assignee, c in counts.items()}
+
+
+def _compute_assignee_workload(workload_index: dict[str, dict[str, Any]], assignee: str) -> dict[str, Any]:
+    """Current workload for an assignee, looked up in a prebuilt workload index."""
+    return workload_index.get(assignee) or _workload(0, 0, 0)
+
+
 def _find_optimal_assignees(
-    plan_id: str,
+    workload_index: dict[str, dict[str, Any]],
     task: dict[str, Any],
     current_assignees: list[str],
     historical_plan_ids: list[str] | None = None,
@@ -89,25 +167,23 @@ def _find_optimal_assignees(
     if historical_plan_ids is None:
         historical_plan_ids = ["congress-2022", "congress-2023", "congress-2024"]
     
-    # Get all assignees from current plan
-    tasks = get_tasks_for_plan(plan_id)
-    all_assignees = set()
-    for t in tasks:
-        all_assignees.update(t.get("assignees") or [])
+    # All assignees in the current plan
+    all_assignees = set(workload_index)
     
     # Get historical throughput
     try:
-        throughput = compute_resource_throughput(historical_plan_ids)
+        throughput = _cached_resource_throughput(historical_plan_ids)
         assignee_throughput = throughput.get("assignee_stats", {})
     except Exception:
         assignee_throughput = {}
     
-    # Score each assignee
-    recommendations = []
+    # Score each assignee as a flat (score, assignee, workload, completion rate) row;
+    # only the top five are turned into recommendation dicts below
+    scored = []
     bucket = task.get("bucketName") or task.get("bucketId", "")
     
     for assignee in all_assignees:
-        workload = _compute_assignee_workload(plan_id, assignee, task.get("id"))
+        workload = _compute_assignee_workload(workload_index, assignee)
         
         # Historical performance for this bucket/task type
         hist_perf = assignee_throughput.get(assignee, {})
@@ -116,30 +192,31 @@ def _find_optimal_assignees(
         
         # Score: lower workload + higher historical performance = better
         score = (1.0 - workload["utilization_score"]) * 0.4 + avg_completion_rate * 0.6
-        
-        recommendations.append({
+        scored.append((score, assignee, workload, avg_completion_rate))
+    
+    # Top 5 by score (highest first); ties keep their order, as with a stable sort
+    return [
+        {
             "assignee": assignee,
             "score": score,
             "workload": workload,
             "historical_completion_rate": avg_completion_rate,
             "reason": f"{assignee}: {workload['active_tasks']} active tasks, {avg_completion_rate:.0%} historical completion rate",
-        })
-    
-    # Sort by score (highest first)
-    recommendations.sort(key=lambda x: x["score"], reverse=True)
-    
-    return recommendations[:5]  # Top 5 recommendations
+        }
+        for score, assignee, workload, avg_completion_rate in heapq.nlargest(5, scored, key=itemgetter(0))
+    ]
 
 
 def _analyze_dependency_risks(
-    plan_id: str,
+    ctx: PlanContext,
     task_id: str,
     monte_carlo_results: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     """Analyze dependency risks and suggest optimizations."""
-    dependencies = get_planner_task_dependencies(plan_id, task_id)
-    tasks = get_tasks_for_plan(plan_id)
-    task_map = {t["id"]: t for t in tasks}
+    dependencies = get_planner_task_dependencies(ctx.plan_id, task_id)
+    task_map = ctx.task_by_id
+    now = _utc_now()
+    critical_path_prob = monte_carlo_results.get("critical_path_probability", {}) if monte_carlo_results else {}
     
     risks = []
     
@@ -153,20 +230,16 @@ def _analyze_dependency_risks(
             continue
         
         # Check if dependency is on critical path
-        is_critical = False
-        if monte_carlo_results:
-            critical_path_tasks = monte_carlo_results.get("critical_path_probability", {})
-            is_critical = critical_path_tasks.get(depends_on_id, 0) > 0.5
+        is_critical = critical_path_prob.get(depends_on_id, 0) > 0.5
         
         # Check if dependency is delayed
-        due_date = _parse_datetime(depends_on_task.get("dueDateTime"))
+        due_date = ctx.due_dt_by_id[depends_on_id]
         completed = _parse_datetime(depends_on_task.get("completedDateTime"))
         is_delayed = False
         delay_days = 0
         
         if due_date and not completed:
             due_utc = _to_utc(due_date)
-            now = _utc_now()
             if due_utc and now > due_utc:
                 is_delayed = True
                 delay_days = (now - due_utc).days
@@ -217,6 +290,7 @@ def _generate_dependency_suggestion(
 
 
 def _generate_timeline_suggestions(
+    ctx: PlanContext,
     task: dict[str, Any],
     monte_carlo_results: dict[str, Any] | None = None,
     markov_analysis: dict[str, Any] | None = None,
@@ -224,8 +298,9 @@ def _generate_timeline_suggestions(
     """Generate timeline optimization suggestions."""
     suggestions = []
     
-    start_date = _parse_datetime(task.get("startDateTime"))
-    due_date = _parse_datetime(task.get("dueDateTime"))
+    # Start/due come pre-parsed with the plan context
+    start_date = ctx.start_dt_by_id[task["id"]]
+    due_date = ctx.due_dt_by_id[task["id"]]
     completed_date = _parse_datetime(task.get("completedDateTime"))
     percent_complete = task.get("percentComplete", 0)
     
@@ -290,17 +365,17 @@ def _generate_timeline_suggestions(
 
 
 def _generate_resource_suggestions(
-    plan_id: str,
+    workload_index: dict[str, dict[str, Any]],
     task: dict[str, Any],
-    historical_plan_ids: list[str] | None = None,
+    optimal_assignees: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
-    """Generate resource optimization suggestions."""
+    """Generate resource optimization suggestions from precomputed workloads and assignee rankings."""
     suggestions = []
     current_assignees = task.get("assignees") or []
     
     # Check current assignee workload
     for assignee in current_assignees:
-        workload = _compute_assignee_workload(plan_id, assignee, task.get("id"))
+        workload = _compute_assignee_workload(workload_index, assignee)
         
         if workload["utilization_score"] > 0.8:  # Over 80% utilization
             suggestions.append({
@@ -311,9 +386,7 @@ def _generate_resource_suggestions(
                 "action": "Consider reassigning some tasks to balance workload.",
             })
     
-    # Get optimal assignee recommendations
-    optimal_assignees = _find_optimal_assignees(plan_id, task, current_assignees, historical_plan_ids)
-    
+    # Suggest the best-ranked assignee if it is someone new
     if optimal_assignees:
         top_recommendation = optimal_assignees[0]
         if top_recommendation["assignee"] not in current_assignees:
@@ -331,7 +404,7 @@ def _generate_resource_suggestions(
 
 
 def _generate_critical_path_suggestions(
-    plan_id: str,
+    ctx: PlanContext,
     task_id: str,
     monte_carlo_results: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
@@ -340,9 +413,7 @@ def _generate_critical_path_suggestions(
     
     # Check if task is on critical path
     try:
-        critical_path = get_critical_path(plan_id)
-        critical_tasks = critical_path.get("critical_path_tasks", [])
-        is_critical = any(t.get("id") == task_id for t in critical_tasks)
+        is_critical = task_id in ctx.critical_ids
     except Exception:
         is_critical = False
     
@@ -379,9 +450,9 @@ def get_task_intelligence(
         - Critical path alerts
         - Overall risk score
     """
-    # Use get_tasks_for_plan so simulated tasks (e.g. default plan seed) are included
-    tasks = get_tasks_for_plan(plan_id)
-    task = next((t for t in tasks if t.get("id") == task_id), None)
+    # Plan tasks (including simulated seed tasks) are loaded once and shared by every helper below
+    ctx = get_plan_context(plan_id)
+    task = ctx.task_by_id.get(task_id)
     
     if not task:
         return {"error": "Task not found"}
@@ -390,10 +461,16 @@ def get_task_intelligence(
     monte_carlo_results = None
     markov_analysis = None
     
+    # A finished task has no remaining timeline to forecast
+    if task.get("status") == "completed" or (task.get("percentComplete") or 0) >= 100:
+        include_simulations = False
+    
     if include_simulations:
+        # Run one after the other: both draw from the module-global random state, so concurrent runs
+        # would interleave their draws by thread scheduling and seeded results would not reproduce
         try:
-            # Run Monte Carlo (use smaller iterations for performance)
-            monte_carlo_results = run_simulation(plan_id, n_iterations=1000)
+            # Run Monte Carlo (one cached run per plan, shared across tasks)
+            monte_carlo_results = _cached_simulation(plan_id)
         except Exception as e:
             logger.warning(f"Monte Carlo simulation failed: {e}")
         
@@ -404,13 +481,13 @@ def get_task_intelligence(
             logger.warning(f"Markov Chain analysis failed: {e}")
     
     # Generate all suggestions
-    dependency_risks = _analyze_dependency_risks(plan_id, task_id, monte_carlo_results)
-    timeline_suggestions = _generate_timeline_suggestions(task, monte_carlo_results, markov_analysis)
-    resource_suggestions = _generate_resource_suggestions(plan_id, task)
-    critical_path_suggestions = _generate_critical_path_suggestions(plan_id, task_id, monte_carlo_results)
-    
-    # Get optimal assignees
-    optimal_assignees = _find_optimal_assignees(plan_id, task, task.get("assignees") or [])
+    dependency_risks = _analyze_dependency_risks(ctx, task_id, monte_carlo_results)
+    timeline_suggestions = _generate_timeline_suggestions(ctx, task, monte_carlo_results, markov_analysis)
+    # Workloads and assignee rankings are computed once and shared with the resource suggestions
+    workload_index = _build_workload_index(ctx, exclude_task_id=task_id)
+    optimal_assignees = _find_optimal_assignees(workload_index, task, task.get("assignees") or [])
+    resource_suggestions = _generate_resource_suggestions(workload_index, task, optimal_assignees)
+    critical_path_suggestions = _generate_critical_path_suggestions(ctx, task_id, monte_carlo_results)
     
     # Compute overall risk score (0-100)
     risk_score = 0
@@ -439,12 +516,31 @@ def get_task_intelligence(
         risk_factors.append("On critical path")
     
     # Check if task is overdue
-    due_date = _parse_datetime(task.get("dueDateTime"))
-    due_utc = _to_utc(due_date)
+    due_utc = _to_utc(ctx.due_dt_by_id[task_id])
     if due_utc and _utc_now() > due_utc and task.get("status") != "completed":
         risk_score += 10
         risk_factors.append("Overdue")
     
+    monte_carlo_summary = None
+    if monte_carlo_results:
+        percentiles = monte_carlo_results.get("percentiles", {})
+        monte_carlo_summary = {
+            "p50_completion": percentiles.get("p50"),
+            "p95_completion": percentiles.get("p95"),
+            "critical_path_probability": monte_carlo_results.get("critical_path_probability", {}).get(task_id, 0),
+        }
+    
+    markov_summary = None
+    if markov_analysis:
+        expected_completion = markov_analysis.get("expected_completion")
+        markov_summary = {
+            "current_state": markov_analysis.get("current_state"),
+            "expected_completion_days": (
+                expected_completion.get("expected_completion_days") if isinstance(expected_completion, dict) else None
+            ),
+            "transition_probabilities": markov_analysis.get("transition_matrix", {}),
+        }
+    
     return {
         "task_id": task_id,
         "plan_id": plan_id,
@@ -455,14 +551,6 @@ def get_task_intelligence(
         "resource_suggestions": resource_suggestions,
         "critical_path_suggestions": critical_path_suggestions,
         "optimal_assignees": optimal_assignees,
-        "monte_carlo_summary": {
-            "p50_completion": monte_carlo_results.get("percentiles", {}).get("p50") if monte_carlo_results else None,
-            "p95_completion": monte_carlo_results.get("percentiles", {}).get("p95") if monte_carlo_results else None,
-            "critical_path_probability": monte_carlo_results.get("critical_path_probability", {}).get(task_id, 0) if monte_carlo_results else 0,
-        } if monte_carlo_results else None,
-        "markov_summary": {
-            "current_state": markov_analysis.get("current_state") if markov_analysis else None,
-            "expected_completion_days": markov_analysis.get("expected_completion", {}).get("expected_completion_days") if markov_analysis and isinstance(markov_analysis.get("expected_completion"), dict) else None,
-            "transition_probabilities": markov_analysis.get("transition_matrix", {}) if markov_analysis else {},
-        } if markov_analysis else None,
+        "monte_carlo_summary": monte_carlo_summary,
+        "markov_summary": markov_summary,
     }
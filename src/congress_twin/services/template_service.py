@@ -6,18 +6,19 @@ clones with new IDs and shifted dates, runs Monte Carlo + Markov for suggestions
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from congress_twin.db.planner_repo import (
-    get_planner_task_details,
+    get_planner_task_details_for_plan,
     get_planner_task_dependencies,
     get_planner_tasks,
     upsert_planner_plan,
-    upsert_planner_task_details,
-    upsert_planner_task_dependencies,
+    upsert_planner_task_details_bulk,
+    upsert_planner_task_dependencies_bulk,
     upsert_planner_tasks,
 )
 from congress_twin.services.historical_data_generator import generate_historical_plan
+from congress_twin.services.planner_service import invalidate_plan_context
 from congress_twin.services.planner_simulated_data import get_simulated_buckets
 
 HISTORICAL_PLAN_IDS = ["congress-2022", "congress-2023", "congress-2024"]
@@ -36,7 +37,7 @@ def _parse_congress_date(s: str | None) -> datetime | None:
     if not s:
         return None
     try:
-        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(s)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt
@@ -44,27 +45,34 @@ def _parse_congress_date(s: str | None) -> datetime | None:
         return None
 
 
-def _shift_task_dates(task: dict[str, Any], days_offset: int) -> dict[str, Any]:
-    """Shift start/due/completed dates by days_offset."""
-    t = dict(task)
+_DATE_KEYS = ("startDateTime", "dueDateTime", "completedDateTime", "createdDateTime", "lastModifiedAt")
 
-    def shift(iso: str | None) -> str | None:
-        if not iso:
-            return None
+
+def _shift_task_dates(tasks: Iterable[dict[str, Any]], days_offset: int) -> Iterator[dict[str, Any]]:
+    """Yield copies of tasks with start/due/completed/created/lastModified dates shifted by days_offset."""
+    delta = timedelta(days=days_offset)
+    # lastModifiedAt usually repeats the start or completed timestamp, so each distinct string is shifted once
+    shifted_by_iso: dict[str, str] = {}
+
+    def shift(iso: str) -> str:
         try:
-            s = iso.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(s)
+            dt = datetime.fromisoformat(iso)
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
-            shifted = dt + timedelta(days=days_offset)
-            return shifted.isoformat().replace("+00:00", "Z")
+            return (dt + delta).isoformat().replace("+00:00", "Z")
         except (ValueError, TypeError):
             return iso
 
-    for key in ("startDateTime", "dueDateTime", "completedDateTime", "createdDateTime", "lastModifiedAt"):
-        if t.get(key):
-            t[key] = shift(t[key])
-    return t
+    for task in tasks:
+        t = dict(task)
+        for key in _DATE_KEYS:
+            iso = t.get(key)
+            if iso:
+                shifted = shifted_by_iso.get(iso)
+                if shifted is None:
+                    shifted = shifted_by_iso[iso] = shift(iso)
+                t[key] = shifted
+        yield t
 
 
 def _generate_new_task_id(prefix: str, index: int) -> str:
@@ -125,18 +133,22 @@ def create_plan_from_template(
             break
     if sample_due:
         try:
-            source_due = datetime.fromisoformat(sample_due.replace("Z", "+00:00"))
+            source_due = datetime.fromisoformat(sample_due)
             days_offset = (congress_dt - source_due).days
         except (ValueError, TypeError):
             days_offset = 90
     else:
         days_offset = 90
 
-    # Clone tasks
-    for i, t in enumerate(source_tasks):
+    # Clone tasks and pick up their checklist/details in the same pass (one read for the whole plan)
+    source_details = get_planner_task_details_for_plan(source_plan_id)
+    details_by_task: dict[str, dict[str, Any]] = {}
+    for i, cloned in enumerate(_shift_task_dates(source_tasks, days_offset)):
+        old_id = cloned["id"]
         new_id = _generate_new_task_id(target_plan_id, i + 1)
-        id_map[t["id"]] = new_id
-        cloned = _shift_task_dates(t, days_offset)
+        id_map[old_id] = new_id
+        if old_id in source_details:
+            details_by_task[new_id] = source_details[old_id]
         cloned["id"] = new_id
         # Rewrite bucketId to target plan prefix
         old_bucket = cloned.get("bucketId", "")
@@ -149,23 +161,19 @@ def create_plan_from_template(
     upsert_planner_plan(target_plan_id, name=target_plan_id, congress_date=congress_dt)
     tasks_created = upsert_planner_tasks(target_plan_id, target_tasks)
 
-    # Copy checklist and details
-    for old_id, new_id in id_map.items():
-        details = get_planner_task_details(source_plan_id, old_id)
-        if details:
-            upsert_planner_task_details(target_plan_id, new_id, details)
-
-    # Copy dependencies (remap task IDs)
-    for old_id, new_id in id_map.items():
-        deps = get_planner_task_dependencies(source_plan_id, old_id)
-        if deps:
-            remapped = []
-            for d in deps:
-                dep_task = d.get("dependsOnTaskId") or d.get("depends_on_task_id")
-                if dep_task and dep_task in id_map:
-                    remapped.append({"dependsOnTaskId": id_map[dep_task], "dependencyType": d.get("dependencyType", "FS")})
-            if remapped:
-                upsert_planner_task_dependencies(target_plan_id, new_id, remapped)
+    upsert_planner_task_details_bulk(target_plan_id, details_by_task)
+
+    # Copy dependencies (remap task IDs; needs the complete id_map, so it follows the clone pass)
+    remapped_by_task: dict[str, list[dict[str, Any]]] = {}
+    for d in get_planner_task_dependencies(source_plan_id):
+        new_id = id_map.get(d.get("taskId"))
+        dep_task = d.get("dependsOnTaskId") or d.get("depends_on_task_id")
+        if new_id and dep_task and dep_task in id_map:
+            remapped_by_task.setdefault(new_id, []).append(
+                {"dependsOnTaskId": id_map[dep_task], "dependencyType": d.get("dependencyType", "FS")}
+            )
+    upsert_planner_task_dependencies_bulk(target_plan_id, remapped_by_task)
+    invalidate_plan_context(target_plan_id)
 
     result: dict[str, Any] = {
         "target_plan_id": target_plan_id,
@@ -0,0 +1,35 @@
+"""Shared fixtures: every test runs against a throwaway SQLite database."""
+
+import time
+
+import pytest
+
+from congress_twin.config import get_settings
+from congress_twin.db import planner_repo
+from congress_twin.services.planner_service import invalidate_plan_context
+
+
+@pytest.fixture(autouse=True)
+def sqlite_db(tmp_path, monkeypatch):
+    """Point settings and the engine at a fresh SQLite file; drop cached plan contexts around each test."""
+    monkeypatch.delenv("POSTGRES_HOST", raising=False)
+    monkeypatch.setenv("SQLITE_DB_PATH", str(tmp_path / "congress_twin_test.db"))
+    get_settings.cache_clear()
+    planner_repo._engine = None
+    invalidate_plan_context()
+    yield
+    invalidate_plan_context()
+    if planner_repo._engine is not None:
+        planner_repo._engine.dispose()
+    planner_repo._engine = None
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def tokyo_tz(monkeypatch):
+    """Run with a local timezone ahead of UTC, so local-vs-UTC readings of naive datetimes differ."""
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
@@ -0,0 +1,111 @@
+"""Graph client with the HTTP layer mocked out."""
+
+import pytest
+
+from congress_twin.services import graph_client
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict, status_code: int = 200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise graph_client.requests.HTTPError(response=self)
+
+    def json(self) -> dict:
+        return self._payload
+
+
+@pytest.fixture
+def graph_http(monkeypatch):
+    """Queue $batch payloads per call; records posted bodies, single GETs and sleeps."""
+    calls = {"batches": [], "gets": [], "sleeps": [], "batch_payloads": [], "get_responses": {}}
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        calls["batches"].append(json)
+        return calls["batch_payloads"].pop(0)
+
+    def fake_get(url, headers=None, timeout=None):
+        calls["gets"].append(url)
+        return calls["get_responses"][url]
+
+    monkeypatch.setattr(graph_client.requests, "post", fake_post)
+    monkeypatch.setattr(graph_client.requests, "get", fake_get)
+    monkeypatch.setattr(graph_client.time, "sleep", calls["sleeps"].append)
+    monkeypatch.setattr(graph_client, "_throttled_until", 0.0)
+    return calls
+
+
+def _details_url(task_id: str) -> str:
+    return f"{graph_client.GRAPH_BASE}/planner/tasks/{task_id}/details"
+
+
+def test_throttled_sub_request_is_rebatched_after_retry_after(graph_http):
+    graph_http["batch_payloads"] = [
+        _FakeResponse({"responses": [
+            {"id": "0", "status": 200, "body": {"description": "first"}},
+            {"id": "1", "status": 429, "headers": {"Retry-After": "7"}},
+        ]}),
+        _FakeResponse({"responses": [{"id": "0", "status": 200, "body": {"description": "second"}}]}),
+    ]
+
+    result = graph_client.fetch_task_details_from_graph_batch(["t1", "t2"], "token")
+
+    assert result == {"t1": {"description": "first"}, "t2": {"description": "second"}}
+    # Second $batch only carries the throttled task, posted after waiting out Retry-After
+    assert [r["url"] for r in graph_http["batches"][1]["requests"]] == ["/planner/tasks/t2/details"]
+    assert len(graph_http["sleeps"]) == 1 and 6 < graph_http["sleeps"][0] <= 7
+    assert graph_http["gets"] == []
+
+
+def test_still_throttled_after_retries_falls_back_to_single_request(graph_http):
+    throttled = {"responses": [{"id": "0", "status": 429, "headers": {"retry-after": "1"}}]}
+    graph_http["batch_payloads"] = [_FakeResponse(throttled) for _ in range(graph_client.GRAPH_BATCH_MAX_RETRIES + 1)]
+    graph_http["get_responses"][_details_url("t1")] = _FakeResponse({"description": "single"})
+
+    result = graph_client.fetch_task_details_from_graph_batch(["t1"], "token")
+
+    assert result == {"t1": {"description": "single"}}
+    assert len(graph_http["batches"]) == graph_client.GRAPH_BATCH_MAX_RETRIES + 1
+    assert len(graph_http["sleeps"]) == graph_client.GRAPH_BATCH_MAX_RETRIES + 1
+    assert graph_http["gets"] == [_details_url("t1")]
+
+
+def test_batch_maps_ok_not_found_and_error_sub_responses(graph_http):
+    graph_http["batch_payloads"] = [_FakeResponse({"responses": [
+        {"id": "2", "status": 400, "body": {"error": {"code": "BadRequest"}}},
+        {"id": "0", "status": 200, "body": {"description": "ok"}},
+        {"id": "1", "status": 404, "body": {"error": {"code": "NotFound"}}},
+    ]})]
+    graph_http["get_responses"][_details_url("t3")] = _FakeResponse({"description": "retried singly"})
+
+    result = graph_client.fetch_task_details_from_graph_batch(["t1", "t2", "t3"], "token")
+
+    # Not-found details are omitted; a non-retryable error is re-fetched on its own
+    assert result == {"t1": {"description": "ok"}, "t3": {"description": "retried singly"}}
+    assert graph_http["gets"] == [_details_url("t3")]
+    assert graph_http["sleeps"] == []
+
+
+def test_batch_error_that_fails_singly_raises(graph_http):
+    graph_http["batch_payloads"] = [_FakeResponse({"responses": [{"id": "0", "status": 403}]})]
+    graph_http["get_responses"][_details_url("t1")] = _FakeResponse({}, status_code=403)
+
+    with pytest.raises(graph_client.requests.HTTPError):
+        graph_client.fetch_task_details_from_graph_batch(["t1"], "token")
+
+
+def test_task_ids_are_split_into_batches_of_the_graph_limit(graph_http):
+    task_ids = [f"t{i}" for i in range(graph_client.GRAPH_BATCH_LIMIT + 5)]
+    graph_http["batch_payloads"] = [
+        _FakeResponse({"responses": [{"id": str(i), "status": 200, "body": {"n": i}} for i in range(n)]})
+        for n in (graph_client.GRAPH_BATCH_LIMIT, 5)
+    ]
+
+    result = graph_client.fetch_task_details_from_graph_batch(task_ids, "token", max_workers=1)
+
+    assert [len(b["requests"]) for b in graph_http["batches"]] == [graph_client.GRAPH_BATCH_LIMIT, 5]
+    assert set(result) == set(task_ids)
+    assert result[f"t{graph_client.GRAPH_BATCH_LIMIT}"] == {"n": 0}
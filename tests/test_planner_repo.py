@@ -0,0 +1,52 @@
+"""Bulk repository writes round-tripped through the SQLite test database."""
+
+from congress_twin.db.planner_repo import (
+    get_planner_task_dependencies,
+    get_planner_task_details,
+    get_planner_task_details_for_plan,
+    upsert_planner_task_dependencies_bulk,
+    upsert_planner_task_details_bulk,
+)
+
+PLAN_ID = "test-plan"
+
+
+def _dep_pairs(plan_id: str) -> set[tuple[str, str]]:
+    return {(r["taskId"], r["dependsOnTaskId"]) for r in get_planner_task_dependencies(plan_id)}
+
+
+def test_details_bulk_upsert_round_trip():
+    checklist = [{"id": "c1", "title": "Book venue", "isChecked": False}]
+    assert upsert_planner_task_details_bulk(PLAN_ID, {
+        "a": {"checklist": checklist, "references": [], "lastModifiedAt": "2026-01-05T10:00:00+00:00"},
+        "b": {"checklist": [], "references": [{"href": "https://example.com"}]},
+    }) == 2
+    upsert_planner_task_details_bulk("other-plan", {"a": {"checklist": [{"id": "x"}]}})
+
+    details = get_planner_task_details_for_plan(PLAN_ID)
+    assert set(details) == {"a", "b"}
+    assert details["a"]["checklist"] == checklist
+    assert details["b"]["references"] == [{"href": "https://example.com"}]
+    assert details["a"] == get_planner_task_details(PLAN_ID, "a")
+
+    # Second upsert updates in place (ON CONFLICT) and leaves other tasks alone
+    upsert_planner_task_details_bulk(PLAN_ID, {"a": {"checklist": [], "references": []}})
+    details = get_planner_task_details_for_plan(PLAN_ID)
+    assert details["a"]["checklist"] == []
+    assert details["b"]["references"] == [{"href": "https://example.com"}]
+    assert upsert_planner_task_details_bulk(PLAN_ID, {}) == 0
+
+
+def test_dependencies_bulk_upsert_replaces_per_task():
+    assert upsert_planner_task_dependencies_bulk(PLAN_ID, {
+        "b": [{"dependsOnTaskId": "a", "dependencyType": "FS"}],
+        "c": [{"dependsOnTaskId": "a"}, {"depends_on_task_id": "b"}],
+    }) == 3
+    upsert_planner_task_dependencies_bulk("other-plan", {"c": [{"dependsOnTaskId": "z"}]})
+    assert _dep_pairs(PLAN_ID) == {("b", "a"), ("c", "a"), ("c", "b")}
+
+    # Listed tasks have their dependencies replaced (an empty list clears them); unlisted tasks keep theirs
+    assert upsert_planner_task_dependencies_bulk(PLAN_ID, {"c": [{"dependsOnTaskId": "b"}], "b": []}) == 1
+    assert _dep_pairs(PLAN_ID) == {("c", "b")}
+    assert _dep_pairs("other-plan") == {("c", "z")}
+    assert {r["dependencyType"] for r in get_planner_task_dependencies(PLAN_ID, "c")} == {"FS"}
@@ -0,0 +1,101 @@
+"""Planner read views on plans stored in the test database."""
+
+import copy
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from congress_twin.db.planner_repo import (
+    set_plan_sync_state,
+    upsert_planner_task_dependencies_bulk,
+    upsert_planner_tasks,
+)
+from congress_twin.services.planner_service import (
+    get_attention_dashboard,
+    get_changes_since_sync,
+    get_critical_path,
+    get_dependencies,
+    get_execution_tasks,
+    get_milestone_analysis,
+    get_plan_context,
+)
+
+PLAN_ID = "test-plan"
+
+
+def _task(task_id: str, days_from_now: int, status: str = "notStarted") -> dict:
+    due = datetime.now(timezone.utc) + timedelta(days=days_from_now)
+    return {"id": task_id, "title": f"Task {task_id}", "status": status, "dueDateTime": due.isoformat()}
+
+
+def test_critical_path_follows_in_plan_chain():
+    upsert_planner_tasks(PLAN_ID, [_task("a", 1), _task("b", 2), _task("c", 3), _task("d", 4)])
+    upsert_planner_task_dependencies_bulk(PLAN_ID, {"b": [{"dependsOnTaskId": "a"}], "c": [{"dependsOnTaskId": "b"}]})
+
+    assert get_critical_path(PLAN_ID)["task_ids"] == ["a", "b", "c"]
+    execution = {t["id"]: t for t in get_execution_tasks(PLAN_ID)}
+    assert [tid for tid, t in execution.items() if t["on_critical_path"]] == ["a", "b", "c"]
+
+
+def test_no_critical_path_when_dependencies_are_all_out_of_plan():
+    upsert_planner_tasks(PLAN_ID, [_task("a", 1), _task("b", 2)])
+    # No dependency rows for this plan: the simulated fallback edges point at tasks outside it
+    ctx = get_plan_context(PLAN_ID)
+    assert ctx.deps
+    assert not ctx.graph.edges
+
+    assert get_critical_path(PLAN_ID)["task_ids"] == []
+    assert get_attention_dashboard(PLAN_ID)["critical_path_due_next"]["count"] == 0
+    assert not any(t["on_critical_path"] for t in get_milestone_analysis(PLAN_ID)["tasks_before_event"])
+    assert not any(t["on_critical_path"] for t in get_execution_tasks(PLAN_ID))
+
+
+def test_mutating_a_view_result_does_not_leak_into_later_calls():
+    upsert_planner_tasks(PLAN_ID, [
+        {**_task("a", 1), "assignees": ["alice"], "assigneeNames": ["Alice"]},
+        {**_task("b", 2), "assignees": ["bob"], "assigneeNames": ["Bob"]},
+    ])
+    upsert_planner_task_dependencies_bulk(PLAN_ID, {"b": [{"dependsOnTaskId": "a"}]})
+    event_date = datetime.now(timezone.utc) + timedelta(days=30)
+    views = {
+        "critical_path": lambda: get_critical_path(PLAN_ID),
+        "attention": lambda: get_attention_dashboard(PLAN_ID),
+        "dependencies": lambda: get_dependencies("b", PLAN_ID),
+        "milestones": lambda: get_milestone_analysis(PLAN_ID, event_date),
+        "execution": lambda: get_execution_tasks(PLAN_ID),
+    }
+    expected = {name: copy.deepcopy(view()) for name, view in views.items()}
+
+    path = get_critical_path(PLAN_ID)
+    path["task_ids"].append("zzz")
+    path["critical_path"][0]["title"] = "changed"
+    path["critical_path"][0]["assigneeNames"].append("Mallory")
+    get_attention_dashboard(PLAN_ID)["due_next_7_days"]["tasks"][0]["status"] = "changed"
+    get_dependencies("b", PLAN_ID)["upstream"][0]["assigneeNames"].clear()
+    get_milestone_analysis(PLAN_ID, event_date)["tasks_before_event"][0]["title"] = "changed"
+    execution = get_execution_tasks(PLAN_ID)
+    execution[0]["assignees"].append("mallory")
+    execution[0]["title"] = "changed"
+
+    # Same cached context is still in use; every view reports what it did before
+    assert {name: view() for name, view in views.items()} == expected
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_changes_since_naive_sync_timestamp_agree_across_paths(numpy_available, tokyo_tz, monkeypatch):
+    if numpy_available:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    now = datetime.now(timezone.utc)
+    # Sync an hour ago, stored naive (as a UTC wall-clock time); only "recent" changed after it
+    upsert_planner_tasks(PLAN_ID, [
+        {**_task("recent", 1), "lastModifiedAt": (now - timedelta(minutes=10)).isoformat()},
+        {**_task("older", 1), "lastModifiedAt": (now - timedelta(hours=3)).isoformat()},
+    ])
+    set_plan_sync_state(PLAN_ID, now, (now - timedelta(hours=1)).replace(tzinfo=None))
+    assert (get_plan_context(PLAN_ID).columns is not None) is numpy_available
+
+    changes = get_changes_since_sync(PLAN_ID)
+    assert [c["id"] for c in changes["changes"]] == ["recent"]
@@ -0,0 +1,68 @@
+"""Task intelligence helpers on in-memory plan contexts."""
+
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from congress_twin.db.planner_repo import upsert_planner_task_dependencies_bulk, upsert_planner_tasks
+from congress_twin.services.planner_service import PlanContext
+from congress_twin.services.task_intelligence import _build_workload_index, get_task_intelligence
+
+PLAN_ID = "test-plan"
+
+
+def _naive_utc(hours_from_now: int) -> str:
+    return (datetime.now(timezone.utc) + timedelta(hours=hours_from_now)).replace(tzinfo=None).isoformat()
+
+
+def test_workload_index_numpy_and_fallback_agree_on_naive_dates(tokyo_tz, monkeypatch):
+    pytest.importorskip("numpy")
+    tasks = [
+        {"id": "t1", "title": "Due soon", "status": "inProgress", "dueDateTime": _naive_utc(2), "assignees": ["alice"]},
+        {"id": "t2", "title": "Late", "status": "notStarted", "dueDateTime": _naive_utc(-2), "assignees": ["alice", "bob"]},
+        {"id": "t3", "title": "Done", "status": "completed", "dueDateTime": _naive_utc(-2), "assignees": ["bob"]},
+        {"id": "t4", "title": "Undated", "status": "notStarted", "assignees": ["bob"]},
+    ]
+    vectorised_ctx = PlanContext(plan_id="p", tasks=tasks)
+    assert vectorised_ctx.columns is not None
+    vectorised = _build_workload_index(vectorised_ctx)
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    fallback_ctx = PlanContext(plan_id="p", tasks=tasks)
+    assert fallback_ctx.columns is None
+    fallback = _build_workload_index(fallback_ctx)
+
+    assert vectorised == fallback
+    assert vectorised["alice"]["overdue_tasks"] == 1
+    assert vectorised["bob"]["active_tasks"] == 2
+    assert vectorised["bob"]["overdue_tasks"] == 1
+
+
+def _dated_task(task_id: str, days_from_now: int) -> dict:
+    due = datetime.now(timezone.utc) + timedelta(days=days_from_now)
+    return {"id": task_id, "title": f"Task {task_id}", "status": "notStarted", "dueDateTime": due.isoformat()}
+
+
+def test_task_on_in_plan_chain_is_flagged_critical():
+    upsert_planner_tasks(PLAN_ID, [_dated_task("a", 5), _dated_task("b", 6), _dated_task("c", 7)])
+    upsert_planner_task_dependencies_bulk(PLAN_ID, {"b": [{"dependsOnTaskId": "a"}]})
+
+    on_path = get_task_intelligence(PLAN_ID, "b", include_simulations=False)
+    assert [s["type"] for s in on_path["critical_path_suggestions"]] == ["critical_path"]
+    assert "On critical path" in on_path["risk_factors"]
+    assert on_path["risk_score"] >= 15
+
+    off_path = get_task_intelligence(PLAN_ID, "c", include_simulations=False)
+    assert off_path["critical_path_suggestions"] == []
+    assert "On critical path" not in off_path["risk_factors"]
+
+
+def test_no_critical_flag_without_in_plan_dependencies():
+    # No dependency rows: the simulated fallback edges all point outside this plan
+    upsert_planner_tasks(PLAN_ID, [_dated_task("a", 5), _dated_task("b", 6)])
+
+    for task_id in ("a", "b"):
+        result = get_task_intelligence(PLAN_ID, task_id, include_simulations=False)
+        assert result["critical_path_suggestions"] == []
+        assert "On critical path" not in result["risk_factors"]